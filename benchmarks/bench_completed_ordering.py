@@ -0,0 +1,168 @@
+import copy
+import datetime
+import os
+import random
+import sys
+import timeit
+
+from typing import Any, List, Optional, Tuple
+
+import click
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+# pylint: disable=wrong-import-position
+from game_selectors.validations.completed_ordering import completed_ordering
+
+
+class BenchGame:
+    title: str
+    completion_number: int
+    date_completed: Optional[datetime.datetime]
+    group_metadata: Any
+
+    def __init__(
+        self,
+        title: str,
+        completion_number: int,
+        date_completed: Optional[datetime.datetime],
+    ):
+        self.title = title
+        self.completion_number = completion_number
+        self.date_completed = date_completed
+        self.group_metadata = None
+
+    def get_copy_with_metadata(self, metadata: Any) -> "BenchGame":
+        g_copy = copy.copy(self)
+        g_copy.group_metadata = metadata
+        return g_copy
+
+
+def find_closest_completed_date_after_date(
+    games: List[BenchGame], date: datetime.datetime
+) -> Tuple[Optional[int], Optional[BenchGame]]:
+    closest_delta: Optional[datetime.timedelta] = None
+    closest_game: Optional[BenchGame] = None
+    closest_idx: Optional[int] = None
+
+    for idx, g in enumerate(games):
+        if g.date_completed is not None and g.date_completed > date:
+            if closest_delta is None or g.date_completed - date < closest_delta:
+                closest_delta = g.date_completed - date
+                closest_game = g
+                closest_idx = idx
+
+    return (closest_idx, closest_game)
+
+
+def linear_completed_ordering(games: List[BenchGame]) -> List[BenchGame]:
+    by_completed_num = sorted(games, key=lambda g: g.completion_number)
+
+    completed_ordered: List[BenchGame] = []
+    latest_date: Optional[datetime.datetime] = None
+
+    for g in by_completed_num:
+        if g.date_completed is not None and (
+            latest_date is None or g.date_completed >= latest_date
+        ):
+            latest_date = g.date_completed
+            completed_ordered.append(copy.copy(g))
+        elif g.date_completed is None:
+            completed_ordered.append(copy.copy(g))
+        else:
+            closest_idx, _ = find_closest_completed_date_after_date(
+                completed_ordered, g.date_completed
+            )
+
+            if closest_idx is not None:
+                completed_ordered.insert(
+                    closest_idx, g.get_copy_with_metadata(g.completion_number)
+                )
+
+    for idx, g in enumerate(completed_ordered):
+        g.completion_number = idx + 1
+
+    return completed_ordered
+
+
+def get_completions(
+    count: int, out_of_order: float, undated: float, seed: int
+) -> List[BenchGame]:
+    rng = random.Random(seed)
+    start = datetime.datetime(2010, 1, 1)
+    games: List[BenchGame] = []
+    day = 0
+
+    for number in range(1, count + 1):
+        day += rng.randint(0, 3)
+        roll = rng.random()
+
+        if roll < undated:
+            date_completed = None
+        elif roll < undated + out_of_order:
+            date_completed = start + datetime.timedelta(days=rng.randint(0, day))
+        else:
+            date_completed = start + datetime.timedelta(days=day)
+
+        games.append(BenchGame(f"Game {number}", number, date_completed))
+
+    return games
+
+
+def to_comparable(games: List[BenchGame]) -> List[Tuple[str, int, Any]]:
+    return [(g.title, g.completion_number, g.group_metadata) for g in games]
+
+
+@click.command()
+@click.option(
+    "--count",
+    "-n",
+    type=int,
+    multiple=True,
+    default=[10000, 20000],
+    help="Number of completions to order",
+)
+@click.option(
+    "--out-of-order",
+    type=float,
+    default=0.05,
+    help="Share of completions entered after later-dated ones",
+)
+@click.option(
+    "--undated", type=float, default=0.02, help="Share of completions with no date"
+)
+@click.option("--repeat", "-r", type=int, default=3, help="Timing repetitions")
+@click.option("--seed", type=int, default=0)
+def main(
+    count: Tuple[int, ...],
+    out_of_order: float,
+    undated: float,
+    repeat: int,
+    seed: int,
+):
+    for n in count:
+        games = get_completions(n, out_of_order, undated, seed)
+
+        if to_comparable(completed_ordering(games)) != to_comparable(
+            linear_completed_ordering(games)
+        ):
+            raise ValueError(f"Orderings differ for {n:,} completions")
+
+        linear = min(
+            timeit.repeat(
+                lambda: linear_completed_ordering(games), number=1, repeat=repeat
+            )
+        )
+        keyed = min(
+            timeit.repeat(lambda: completed_ordering(games), number=1, repeat=repeat)
+        )
+
+        print(
+            f"{n:,} completions: linear scan {linear:.3f}s, "
+            f"keyed sort {keyed:.3f}s ({linear / keyed:,.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    # pylint: disable=no-value-for-parameter
+    main()
@@ -0,0 +1,201 @@
+import enum
+import functools
+import hashlib
+import os
+import sys
+import types
+
+from typing import Any, Dict, List, Set, Tuple
+
+SOURCE_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+class CodeFingerprint:
+    _digest: Any
+    _seen: Set[int]
+
+    def __init__(self):
+        self._digest = hashlib.blake2b(digest_size=16)
+        self._seen = set()
+
+    @staticmethod
+    def __is_source_file(file_name: str) -> bool:
+        return os.path.abspath(file_name).startswith(SOURCE_ROOT)
+
+    @staticmethod
+    def __is_source_module(module: types.ModuleType) -> bool:
+        file_name = getattr(module, "__file__", None)
+        return file_name is not None and CodeFingerprint.__is_source_file(file_name)
+
+    @staticmethod
+    def __is_source_class(value: Any) -> bool:
+        return isinstance(value, type) and CodeFingerprint.__is_source_module(
+            sys.modules.get(value.__module__)
+        )
+
+    def __write(self, *parts: Any):
+        for part in parts:
+            self._digest.update(str(part).encode("utf-8"))
+            self._digest.update(b"\0")
+
+    def __visit(self, value: Any) -> bool:
+        if id(value) in self._seen:
+            self.__write("<seen>")
+            return False
+
+        self._seen.add(id(value))
+        return True
+
+    def __update_code(
+        self,
+        code: types.CodeType,
+        _globals: Dict[str, Any],
+        owners: Tuple[type, ...] = (),
+    ):
+        if not self.__visit(code):
+            return
+
+        self.__write("<code>", code.co_code, code.co_names, len(code.co_consts))
+
+        for const in code.co_consts:
+            if isinstance(const, types.CodeType):
+                self.__update_code(const, _globals, owners)
+            else:
+                self.update(const)
+
+        modules = []
+        classes: List[type] = []
+
+        for name in code.co_names:
+            if name not in _globals:
+                continue
+
+            value = _globals[name]
+            self.__write(name)
+            self.update(value)
+
+            if isinstance(value, types.ModuleType) and self.__is_source_module(value):
+                modules.append(value)
+            elif self.__is_source_class(value):
+                classes.append(value)
+            elif self.__is_source_class(type(value)):
+                classes.append(type(value))
+
+        for module in modules:
+            for name in code.co_names:
+                if name in vars(module):
+                    self.__write(module.__name__, name)
+                    self.update(vars(module)[name])
+
+        for owner in classes + [o for o in owners if o not in classes]:
+            for name in code.co_names:
+                for klass in owner.__mro__:
+                    if name in vars(klass) and self.__is_source_class(klass):
+                        self.__write(klass.__qualname__, name)
+                        self.__update_attribute(vars(klass)[name], owner)
+                        break
+
+    def __update_attribute(self, value: Any, owner: type):
+        if isinstance(value, (staticmethod, classmethod)):
+            self.__write(type(value).__name__)
+            value = value.__func__
+        elif isinstance(value, property):
+            self.__write("property")
+
+            for accessor in (value.fget, value.fset, value.fdel):
+                self.__update_attribute(accessor, owner)
+
+            return
+
+        if isinstance(value, types.FunctionType):
+            self.__update_function(value, (owner,))
+        else:
+            self.update(value)
+
+    def __update_function(
+        self, value: types.FunctionType, owners: Tuple[type, ...] = ()
+    ):
+        self.__write("<function>", value.__module__, value.__qualname__)
+
+        if not self.__is_source_file(value.__code__.co_filename) or not self.__visit(
+            value
+        ):
+            return
+
+        cells = []
+
+        for cell in value.__closure__ or ():
+            try:
+                cells.append(cell.cell_contents)
+            except ValueError:
+                cells.append(None)
+
+        instance_owners = tuple(
+            type(c) for c in cells if self.__is_source_class(type(c))
+        )
+
+        self.__update_code(value.__code__, value.__globals__, owners + instance_owners)
+        self.update(value.__defaults__)
+        self.update(value.__kwdefaults__)
+        self.update(cells)
+
+    def update(self, value: Any):
+        if value is None or isinstance(
+            value, (bool, int, float, complex, str, bytes, enum.Enum)
+        ):
+            self.__write(type(value).__name__, repr(value))
+        elif isinstance(value, (tuple, list)):
+            if self.__visit(value):
+                self.__write(type(value).__name__, len(value))
+
+                for item in value:
+                    self.update(item)
+        elif isinstance(value, (set, frozenset)):
+            nested = []
+
+            for item in value:
+                fingerprint = CodeFingerprint()
+                fingerprint.update(item)
+                nested.append(fingerprint.hexdigest())
+
+            self.__write(type(value).__name__, *sorted(nested))
+        elif isinstance(value, dict):
+            if self.__visit(value):
+                self.__write("dict", len(value))
+
+                for key, item in value.items():
+                    self.update(key)
+                    self.update(item)
+        elif isinstance(value, types.FunctionType):
+            self.__update_function(value)
+        elif isinstance(value, types.MethodType):
+            owner = (
+                value.__self__
+                if isinstance(value.__self__, type)
+                else type(value.__self__)
+            )
+            self.__write("<method>", owner.__qualname__)
+
+            if isinstance(value.__func__, types.FunctionType) and (
+                self.__is_source_class(owner)
+            ):
+                self.__update_function(value.__func__, (owner,))
+            else:
+                self.update(value.__func__)
+        elif isinstance(value, functools.partial):
+            self.__write("<partial>")
+            self.update(value.func)
+            self.update(value.args)
+            self.update(value.keywords)
+        elif isinstance(value, type):
+            self.__write("<type>", value.__module__, value.__qualname__)
+        elif isinstance(value, types.ModuleType):
+            self.__write("<module>", value.__name__)
+        elif callable(value) and hasattr(value, "__wrapped__"):
+            self.__write("<wrapped>", type(value).__module__, type(value).__qualname__)
+            self.update(value.__wrapped__)
+        else:
+            self.__write("<object>", type(value).__module__, type(value).__qualname__)
+
+    def hexdigest(self) -> str:
+        return self._digest.hexdigest()
@@ -1,7 +1,9 @@
+from collections import Counter
 from enum import Enum
-from typing import Dict, List, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 import asyncio
+import datetime
 import numpy as np
 
 from clients import (
@@ -11,12 +13,14 @@ from clients import (
     MobyGamesClient,
     RateLimit,
 )
-from excel_game import ExcelGame
+from excel_game import ExcelGame, ExcelPlatform
 from excel_loader import ExcelLoader
 from match_validator import MatchValidator
 
 from excel_backed_cache import ExcelBackedCache
-from excel_filter import ExcelFilter
+from excel_filter import ExcelFilter, FilterFlag, MODE_FLAGS
+from game_grouping import GameGrouping
+from picker_enums import PickerMode
 
 
 class Percentile(Enum):
@@ -31,6 +35,18 @@ class Percentile(Enum):
     P99 = 8
 
 
+PERCENTILE_BUCKET_NAMES = (
+    "1-5th",
+    "5-10th",
+    "10-25th",
+    "25-49th",
+    "50-74th",
+    "75-89th",
+    "90-94th",
+    "95-98th",
+)
+
+
 class DataProvider:
     _games: List[ExcelGame]
     _completed_games: List[ExcelGame]
@@ -45,12 +61,22 @@ class DataProvider:
     _gbcache: Dict[str, Set[str]]
     _loader: ExcelLoader
     _name_collisions: Dict[str, int]
+    _no_cache: bool
+    _merged: Optional[Tuple[List[ExcelGame], List[Tuple[ExcelGame, str]]]]
+    _collections: Optional[List[ExcelGame]]
+    _franchise_progress: Optional[Dict[Optional[str], Tuple[int, int]]]
+    _platform_progress: Optional[Dict[ExcelPlatform | str, Tuple[int, int]]]
 
     _percentiles: Dict[Percentile, float]
+    _percentile_buckets: Optional[Dict[float, Tuple[int, int]]]
+    _percentile_labels: Optional[Tuple[str, ...]]
+    _reference_time: datetime.datetime
+    _filter_flags: np.ndarray
 
     __BASE_DROPBOX_FOLDER = "C:\\Users\\zachd\\Dropbox\\Video Game Lists"
     __EXCEL_SHEET_NAME = "Games Master List - Final.xlsx"
     __CACHE_FILE_NAME = "cache.pkl"
+    __MERGE_CACHE_FILE_NAME = "merge.pkl"
     __MOBY_GAMES_CACHE_FILE_NAME = "mbcache.pkl"
     __GIANT_BOMB_CACHE_FILE_NAME = "gbcache.pkl"
 
@@ -63,6 +89,14 @@ class DataProvider:
             self._validator, rate_limit=RateLimit(1, DatePart.SECOND)
         )
         self._name_collisions = {}
+        self._no_cache = no_cache
+        self._merged = None
+        self._collections = None
+        self._franchise_progress = None
+        self._platform_progress = None
+        self._percentile_buckets = None
+        self._percentile_labels = None
+        self._reference_time = datetime.datetime.now()
 
         self._loader = ExcelLoader(self.__get_excel_file_name())
 
@@ -91,6 +125,11 @@ class DataProvider:
                     self._games_on_order,
                 ) = cache_data
 
+                self.__set_filter_flags()
+                self._unplayed_candidates = self.get_games_with_flags(
+                    FilterFlag.UNPLAYED_CANDIDATE
+                )
+
                 p1, p5, p10, p25, med, p75, p90, p95, p99 = np.percentile(
                     [g.combined_rating for g in self._games],
                     [1, 5, 10, 25, 50, 75, 90, 95, 99],
@@ -149,15 +188,9 @@ class DataProvider:
             )
         )
 
-        self._unplayed_candidates = list(
-            filter(
-                lambda g: ExcelFilter.is_not_low_priority(g)
-                and ExcelFilter.is_playable(g)
-                and ExcelFilter.is_playable_by_language(g)
-                and ExcelFilter.is_unplayed(g)
-                and ExcelFilter.is_released(g),
-                self._games,
-            )
+        self.__set_filter_flags()
+        self._unplayed_candidates = self.get_games_with_flags(
+            FilterFlag.UNPLAYED_CANDIDATE
         )
 
         self._completed_games = self._loader.completed_games
@@ -177,12 +210,79 @@ class DataProvider:
     def __get_excel_file_name(self) -> str:
         return f"{self.__BASE_DROPBOX_FOLDER}\\{self.__EXCEL_SHEET_NAME}"
 
+    def __set_filter_flags(self):
+        self._filter_flags = np.fromiter(
+            (ExcelFilter.get_flags(g, self._reference_time) for g in self._games),
+            dtype=np.uint16,
+            count=len(self._games),
+        )
+
+    def get_games_with_flags(
+        self, flags: FilterFlag, mode: Optional[PickerMode] = None
+    ) -> List[ExcelGame]:
+        required = flags | (MODE_FLAGS[mode] if mode is not None else FilterFlag(0))
+
+        return [
+            self._games[idx]
+            for idx in np.flatnonzero((self._filter_flags & required) == required)
+        ]
+
     def get_name_collisions(self) -> Dict[str, int]:
         return self._name_collisions
 
     def get_excel_loader(self) -> ExcelLoader:
         return self._loader
 
+    def get_merged_games(
+        self,
+    ) -> Tuple[List[ExcelGame], List[Tuple[ExcelGame, str]]]:
+        if self._merged is not None:
+            return self._merged
+
+        merged = (
+            None if self._no_cache else self._cache.load(self.__MERGE_CACHE_FILE_NAME)
+        )
+
+        if merged is None:
+            merged_games, errors = self._loader.merge()
+            merged = (merged_games, errors)
+            self._cache.write(self.__MERGE_CACHE_FILE_NAME, merged)
+
+        self._merged = merged
+        return self._merged
+
+    def get_collections(self) -> List[ExcelGame]:
+        if self._collections is None:
+            merged_games, _ = self.get_merged_games()
+            self._collections = list(filter(lambda g: any(g.child_games), merged_games))
+
+        return self._collections
+
+    def __count_progress(
+        self, key: Callable[[ExcelGame], Any]
+    ) -> Dict[Any, Tuple[int, int]]:
+        played = Counter(map(key, self._played_games))
+        unplayed = Counter(map(key, self._unplayed_candidates))
+
+        return {
+            k: (played[k], played[k] + unplayed[k])
+            for k in played.keys() | unplayed.keys()
+        }
+
+    def get_franchise_progress(self, franchise: Optional[str]) -> Tuple[int, int]:
+        if self._franchise_progress is None:
+            self._franchise_progress = self.__count_progress(lambda g: g.franchise)
+
+        return self._franchise_progress.get(franchise, (0, 0))
+
+    def get_platform_progress(self, platform: ExcelPlatform | str) -> Tuple[int, int]:
+        if self._platform_progress is None:
+            self._platform_progress = self.__count_progress(
+                GameGrouping.get_platform_key
+            )
+
+        return self._platform_progress.get(platform, (0, 0))
+
     def get_giant_bomb_cache(self) -> Dict[str, Set[str]]:
         return self._gbcache
 
@@ -213,24 +313,61 @@ class DataProvider:
     def get_percentile_ranking(self, percentile: Percentile) -> float:
         return self._percentiles[percentile]
 
+    def __get_percentile_thresholds(self) -> np.ndarray:
+        return np.array([self._percentiles[p] for p in Percentile])
+
+    def __get_percentile_buckets(self, rating: float) -> Tuple[int, int]:
+        if self._percentile_buckets is None:
+            thresholds = self.__get_percentile_thresholds()
+            ratings = np.unique([g.combined_rating for g in self._games])
+            rankings = np.minimum(
+                np.searchsorted(thresholds, ratings, side="left"), len(thresholds) - 1
+            )
+            buckets = np.searchsorted(thresholds, ratings, side="right")
+
+            self._percentile_buckets = dict(
+                zip(ratings.tolist(), zip(rankings.tolist(), buckets.tolist()))
+            )
+
+        percentile_buckets = self._percentile_buckets.get(rating)
+
+        if percentile_buckets is None:
+            thresholds = self.__get_percentile_thresholds()
+            percentile_buckets = (
+                min(
+                    int(np.searchsorted(thresholds, rating, side="left")),
+                    len(thresholds) - 1,
+                ),
+                int(np.searchsorted(thresholds, rating, side="right")),
+            )
+            self._percentile_buckets[rating] = percentile_buckets
+
+        return percentile_buckets
+
+    def get_percentile_labels(self) -> Tuple[str, ...]:
+        if self._percentile_labels is None:
+            percentiles = [self._percentiles[p] for p in Percentile]
+
+            self._percentile_labels = (
+                f"1st (<{percentiles[0]:.02%})",
+                *(
+                    f"{name} ({low:.02%}-{high:.02%})"
+                    for name, low, high in zip(
+                        PERCENTILE_BUCKET_NAMES, percentiles, percentiles[1:]
+                    )
+                ),
+                f"99th (>={percentiles[-1]:.02%})",
+            )
+
+        return self._percentile_labels
+
     def get_percentile_ranking_for_game(self, game: ExcelGame) -> Percentile:
-        if game.combined_rating <= self._percentiles[Percentile.P1]:
-            return Percentile.P1
-        if game.combined_rating <= self._percentiles[Percentile.P5]:
-            return Percentile.P5
-        if game.combined_rating <= self._percentiles[Percentile.P10]:
-            return Percentile.P10
-        if game.combined_rating <= self._percentiles[Percentile.P25]:
-            return Percentile.P25
-        if game.combined_rating <= self._percentiles[Percentile.MED]:
-            return Percentile.MED
-        if game.combined_rating <= self._percentiles[Percentile.P75]:
-            return Percentile.P75
-        if game.combined_rating <= self._percentiles[Percentile.P90]:
-            return Percentile.P90
-        if game.combined_rating <= self._percentiles[Percentile.P95]:
-            return Percentile.P95
-        return Percentile.P99
+        ranking, _ = self.__get_percentile_buckets(game.combined_rating)
+        return Percentile(ranking)
+
+    def get_percentile_bucket(self, game: ExcelGame) -> int:
+        _, bucket = self.__get_percentile_buckets(game.combined_rating)
+        return bucket
 
     @property
     def backloggd_client(self) -> BackloggdClient:
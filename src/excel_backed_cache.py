@@ -13,6 +13,9 @@ class ExcelBackedCache:
     def __get_excel_file_name(self) -> str:
         return f"{self.__BASE_DROPBOX_FOLDER}\\{self.__EXCEL_SHEET_NAME}"
 
+    def get_excel_modify_time(self) -> int:
+        return os.stat(self.__get_excel_file_name()).st_mtime_ns
+
     def load(self, cache_file_name: str, use_excel_modify_date: bool = True) -> Any:
         if not os.path.exists(cache_file_name):
             return None
@@ -1,3 +1,5 @@
+from enum import IntFlag
+from typing import Dict, Optional
 import datetime
 
 from excel_game import (
@@ -11,6 +13,53 @@ from excel_game import (
 from picker_constants import HANDHELD_PLATFORMS
 from picker_enums import PickerMode
 
+LANGUAGE_DEPENDENT_GENRES = frozenset(
+    (
+        ExcelGenre.ACTION_RPG,
+        ExcelGenre.ADVENTURE,
+        ExcelGenre.CARD_GAME,
+        ExcelGenre.COMPUTER_RPG,
+        ExcelGenre.DUNGEON_CRAWLER,
+        ExcelGenre.STRATEGY_RPG,
+        ExcelGenre.TURN_BASED_RPG,
+        ExcelGenre.VISUAL_NOVEL,
+        ExcelGenre.ACTION_ADVENTURE,
+        ExcelGenre.TURN_BASED_STRATEGY,
+        ExcelGenre.TURN_BASED_TACTICS,
+        ExcelGenre.STRATEGY,
+        ExcelGenre.MMORPG,
+        ExcelGenre.REAL_TIME_TACTICS,
+        ExcelGenre.ROGUELIKE,
+        ExcelGenre.SIMULATION,
+        ExcelGenre.SURVIVAL_HORROR,
+        ExcelGenre.TEXT_ADVENTURE,
+        ExcelGenre.TRIVIA,
+    )
+)
+
+
+class FilterFlag(IntFlag):
+    NOT_LOW_PRIORITY = 1
+    PLAYABLE = 2
+    PLAYABLE_BY_LANGUAGE = 4
+    UNPLAYED = 8
+    RELEASED = 16
+    IN_HANDHELD_MODE = 32
+    IN_HIGH_PRIORITY_MODE = 64
+    IN_OWNED_MODE = 128
+
+    UNPLAYED_CANDIDATE = (
+        NOT_LOW_PRIORITY | PLAYABLE | PLAYABLE_BY_LANGUAGE | UNPLAYED | RELEASED
+    )
+
+
+MODE_FLAGS: Dict[PickerMode, FilterFlag] = {
+    PickerMode.ALL: FilterFlag(0),
+    PickerMode.HANDHELD: FilterFlag.IN_HANDHELD_MODE,
+    PickerMode.HIGH_PRIORITY: FilterFlag.IN_HIGH_PRIORITY_MODE,
+    PickerMode.OWNED: FilterFlag.IN_OWNED_MODE,
+}
+
 
 class ExcelFilter:
     @staticmethod
@@ -67,28 +116,7 @@ class ExcelFilter:
         return (
             game.translation is None
             or game.translation != TranslationStatus.NONE
-            or game.genre
-            not in (
-                ExcelGenre.ACTION_RPG,
-                ExcelGenre.ADVENTURE,
-                ExcelGenre.CARD_GAME,
-                ExcelGenre.COMPUTER_RPG,
-                ExcelGenre.DUNGEON_CRAWLER,
-                ExcelGenre.STRATEGY_RPG,
-                ExcelGenre.TURN_BASED_RPG,
-                ExcelGenre.VISUAL_NOVEL,
-                ExcelGenre.ACTION_ADVENTURE,
-                ExcelGenre.TURN_BASED_STRATEGY,
-                ExcelGenre.TURN_BASED_TACTICS,
-                ExcelGenre.STRATEGY,
-                ExcelGenre.MMORPG,
-                ExcelGenre.REAL_TIME_TACTICS,
-                ExcelGenre.ROGUELIKE,
-                ExcelGenre.SIMULATION,
-                ExcelGenre.SURVIVAL_HORROR,
-                ExcelGenre.TEXT_ADVENTURE,
-                ExcelGenre.TRIVIA,
-            )
+            or game.genre not in LANGUAGE_DEPENDENT_GENRES
         )
 
     @staticmethod
@@ -96,8 +124,30 @@ class ExcelFilter:
         return not game.completed
 
     @staticmethod
-    def is_released(game: ExcelGame) -> bool:
-        return (
-            game.release_date is not None
-            and game.release_date <= datetime.datetime.now()
+    def is_released(
+        game: ExcelGame, reference_time: Optional[datetime.datetime] = None
+    ) -> bool:
+        return game.release_date is not None and game.release_date <= (
+            reference_time or datetime.datetime.now()
         )
+
+    @staticmethod
+    def get_flags(game: ExcelGame, reference_time: datetime.datetime) -> FilterFlag:
+        flags = FilterFlag(0)
+
+        if ExcelFilter.is_not_low_priority(game):
+            flags |= FilterFlag.NOT_LOW_PRIORITY
+        if ExcelFilter.is_playable(game):
+            flags |= FilterFlag.PLAYABLE
+        if ExcelFilter.is_playable_by_language(game):
+            flags |= FilterFlag.PLAYABLE_BY_LANGUAGE
+        if ExcelFilter.is_unplayed(game):
+            flags |= FilterFlag.UNPLAYED
+        if ExcelFilter.is_released(game, reference_time):
+            flags |= FilterFlag.RELEASED
+
+        for mode, mode_flag in MODE_FLAGS.items():
+            if mode_flag and ExcelFilter.included_in_mode(game, mode):
+                flags |= mode_flag
+
+        return flags
@@ -1,14 +1,18 @@
 import asyncio
+import gzip
 import inspect
 import json
 import os
 import re
-import sys
-from typing import Dict, List, Set
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple
+
+import click
 
 from clients import (
     AlternateTitle,
-    Cover,
     DatePart,
     Game,
     GamePlatform,
@@ -17,10 +21,9 @@ from clients import (
     MobyGamesClient,
     Platform,
     RateLimit,
-    Screenshot,
 )
 
-from excel_game import ExcelPlatform
+from excel_game import ExcelGame, ExcelPlatform
 from excel_loader import ExcelLoader
 from match_validator import MatchValidator
 
@@ -171,9 +174,39 @@ MOBY_NAME_TO_SHEET_NAME: Dict[str, Set[ExcelPlatform] | ExcelPlatform] = {
 }
 
 
+EXCLUDED_GENRES = ("add-on", "compilation", "special edition")
+EXCLUDED_GENRE_CATEGORIES = ("add-on", "special edition")
+JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+EXCLUSIVES_FOLDER = "exclusives"
+COMPRESSED_SUFFIX = ".gz"
+COMPACT_GAME_FIELDS = (
+    "alternate_titles",
+    "id",
+    "moby_score",
+    "moby_url",
+    "platforms",
+    "title",
+)
+
+
 def platform_to_file_name(platform: str) -> str:
     clean_name = re.sub(r"[^A-Za-z0-9-_]", "_", platform).lower()
-    return f"exclusives/{clean_name}.json"
+    return f"{EXCLUSIVES_FOLDER}/{clean_name}.json"
+
+
+def get_exclusives_file(file_path: str) -> Optional[str]:
+    for path in (file_path, f"{file_path}{COMPRESSED_SUFFIX}"):
+        if os.path.isfile(path):
+            return path
+
+    return None
+
+
+def open_exclusives(file_path: str) -> TextIO:
+    if file_path.endswith(COMPRESSED_SUFFIX):
+        return gzip.open(file_path, "rt", encoding="utf-8")
+
+    return open(file_path, "r", encoding="utf-8")
 
 
 async def get_games(
@@ -185,91 +218,130 @@ async def get_games(
 
 async def get_games_batch(client: MobyGamesClient, platform_id: int) -> List[Game]:
     games = await get_games(client, platform_id)
-    game_len = len(games)
-    last_game_len = 0
+    page_len = len(games)
 
     offset = 100
-    while game_len != last_game_len and len(games) % 100 == 0:
-        games.extend(await get_games(client, platform_id, offset))
+    while page_len == 100:
+        page = await get_games(client, platform_id, offset)
+        page_len = len(page)
+        games.extend(page)
         offset += 100
 
     return games
 
 
-async def find_exclusives(platform: str) -> List[Game]:
-    file_path = platform_to_file_name(platform)
+def is_excluded_genre(name: str, category_name: str) -> bool:
+    return name.lower() in EXCLUDED_GENRES or category_name.lower() in (
+        EXCLUDED_GENRE_CATEGORIES
+    )
 
-    if os.path.isfile(file_path):
-        with open(file_path, "r", encoding="utf-8") as f:
-            games_json = json.loads(f.read())
 
-            return [
-                Game(
-                    (
-                        [
-                            AlternateTitle(alt["description"], alt["title"])
-                            for alt in game["alternate_titles"]
-                        ]
-                        if game.get("alternate_titles") is not None
-                        else []
-                    ),
-                    game["description"],
-                    game["id"],
-                    [
-                        Genre(
-                            GenreCategory(
-                                genre["category"]["name"], genre["category"]["id"]
-                            ),
-                            genre["id"],
-                            genre["name"],
-                        )
-                        for genre in game["genres"]
-                    ],
-                    game["moby_score"],
-                    game["moby_url"],
-                    game["num_votes"],
-                    game["official_url"],
-                    [
-                        GamePlatform(
-                            Platform(_platform[0]["id"], _platform[0]["name"]),
-                            _platform[1],
-                        )
-                        for _platform in game["platforms"]
-                    ],
-                    (
-                        Cover(
-                            game["sample_cover"]["height"],
-                            game["sample_cover"]["image_url"],
-                            game["sample_cover"]["platforms"],
-                            game["sample_cover"]["thumbnail_image_url"],
-                            game["sample_cover"]["width"],
-                        )
-                        if game.get("sample_cover") is not None
-                        else None
-                    ),
-                    [
-                        Screenshot(
-                            screenshot["caption"],
-                            screenshot["height"],
-                            screenshot["image_url"],
-                            screenshot["thumbnail_image_url"],
-                            screenshot["width"],
-                        )
-                        for screenshot in game["sample_screenshots"]
-                    ],
-                    game["title"],
-                )
-                for game in filter(
-                    lambda g: not any(
-                        genre["name"].lower()
-                        in ("add-on", "compilation", "special edition")
-                        or genre["category"]["name"].lower()
-                        in ("add-on", "special edition")
-                        for genre in g["genres"]
-                    ),
-                    games_json,
-                )
+def iter_json_array(f: TextIO, chunk_size: int = 1 << 16) -> Iterator[Any]:
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    in_array = False
+
+    def fill() -> bool:
+        nonlocal buffer, pos
+        chunk = f.read(chunk_size)
+        buffer = buffer[pos:] + chunk
+        pos = 0
+        return bool(chunk)
+
+    while True:
+        pos = JSON_WHITESPACE.match(buffer, pos).end()
+
+        if pos == len(buffer):
+            if not fill():
+                raise ValueError("Unexpected end of JSON array")
+            continue
+
+        if not in_array:
+            if buffer[pos] != "[":
+                raise ValueError("Expected a JSON array")
+            in_array = True
+            pos += 1
+            continue
+
+        if buffer[pos] == "]":
+            return
+
+        if buffer[pos] == ",":
+            pos += 1
+            continue
+
+        try:
+            element, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if not fill():
+                raise
+            continue
+
+        # Scalars can be cut off at a chunk boundary and still decode
+        if end == len(buffer) and fill():
+            continue
+
+        pos = end
+        yield element
+
+
+def game_from_json(game: Dict[str, Any]) -> Game:
+    # Descriptions and media are never used downstream, so they're dropped
+    # here rather than kept alive for the lifetime of the report.
+    return Game(
+        (
+            [
+                AlternateTitle(alt["description"], alt["title"])
+                for alt in game["alternate_titles"]
             ]
+            if game.get("alternate_titles") is not None
+            else []
+        ),
+        None,
+        game["id"],
+        [
+            Genre(
+                GenreCategory(genre["category"]["name"], genre["category"]["id"]),
+                genre["id"],
+                genre["name"],
+            )
+            for genre in game["genres"]
+        ],
+        game["moby_score"],
+        game["moby_url"],
+        game.get("num_votes"),
+        game.get("official_url"),
+        [
+            GamePlatform(
+                Platform(_platform[0]["id"], _platform[0]["name"]),
+                _platform[1],
+            )
+            for _platform in game["platforms"]
+        ],
+        None,
+        [],
+        game["title"],
+    )
+
+
+def iter_exclusives(file_path: str) -> Iterator[Game]:
+    with open_exclusives(file_path) as f:
+        for game in iter_json_array(f):
+            if any(
+                is_excluded_genre(genre["name"], genre["category"]["name"])
+                for genre in game["genres"]
+            ):
+                continue
+
+            yield game_from_json(game)
+
+
+async def find_exclusives(platform: str) -> Iterable[Game]:
+    file_path = get_exclusives_file(platform_to_file_name(platform))
+
+    if file_path is not None:
+        return iter_exclusives(file_path)
 
     client = MobyGamesClient(MatchValidator(), rate_limit=RateLimit(1, DatePart.SECOND))
 
@@ -290,108 +362,318 @@ async def find_exclusives(platform: str) -> List[Game]:
         filter(
             lambda g: len(g.platforms) == 1
             and not any(
-                genre.name.lower() in ("add-on", "compilation", "special edition")
-                or genre.category.name.lower() in ("add-on", "special edition")
-                for genre in g.genres
+                is_excluded_genre(genre.name, genre.category.name) for genre in g.genres
             ),
             all_platform_games,
         )
     )
 
 
-async def find_all_exclusives():
-    client = MobyGamesClient(MatchValidator())
+def to_json_default(c: Any) -> Any:
+    return c.__dict__ if inspect.isclass(type(c)) else str(c)
 
-    platforms = await client.platforms()
 
-    for platform in platforms:
-        file_path = platform_to_file_name(platform.name)
+def write_atomic(file_path: str, data: str, compress: bool = False):
+    tmp_path = f"{file_path}.tmp"
+
+    with (
+        gzip.open(tmp_path, "wt", encoding="utf-8")
+        if compress
+        else open(tmp_path, "w", encoding="utf-8")
+    ) as f:
+        f.write(data)
+
+    os.replace(tmp_path, file_path)
+
+
+def to_compact_json(game: Dict[str, Any]) -> Dict[str, Any]:
+    compact = {field: game.get(field) for field in COMPACT_GAME_FIELDS}
+    compact["genres"] = [
+        {
+            "category": genre["category"],
+            "id": genre["id"],
+            "name": genre["name"],
+        }
+        for genre in game["genres"]
+    ]
+
+    return compact
+
+
+def write_exclusives(
+    file_path: str,
+    games: List[Dict[str, Any]],
+    compact: bool = False,
+    compress: bool = False,
+) -> str:
+    if compress:
+        file_path = f"{file_path}{COMPRESSED_SUFFIX}"
+
+    write_atomic(
+        file_path,
+        (
+            json.dumps(
+                [to_compact_json(g) for g in games],
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+            if compact
+            else json.dumps(games, sort_keys=True, indent=4)
+        ),
+        compress,
+    )
 
-        if os.path.isfile(file_path):
+    return file_path
+
+
+def convert_exclusives(compress: bool = False, folder: str = EXCLUSIVES_FOLDER):
+    for entry in sorted(os.scandir(folder), key=lambda e: e.name):
+        if not entry.is_file() or not (
+            entry.name.endswith(".json")
+            or entry.name.endswith(f".json{COMPRESSED_SUFFIX}")
+        ):
             continue
 
-        print(f"Requesting all games for {platform.name}")
+        file_path = f"{folder}/{entry.name}"
+        size = entry.stat().st_size
 
-        all_platform_games = await get_games_batch(client, platform.id)
+        with open_exclusives(file_path) as f:
+            games = list(iter_json_array(f))
 
-        platform_exclusives = list(
-            filter(lambda g: len(g.platforms) == 1, all_platform_games)
+        converted_path = write_exclusives(
+            file_path.removesuffix(COMPRESSED_SUFFIX),
+            games,
+            compact=True,
+            compress=compress,
         )
 
-        if not any(platform_exclusives):
-            continue
+        if converted_path != file_path:
+            os.remove(file_path)
+
+        print(
+            f"Converted {file_path} to {converted_path} "
+            f"({size:,}B -> {os.path.getsize(converted_path):,}B)"
+        )
+
+
+class ExclusivesCrawler:
+    _client: MobyGamesClient
+    _folder: str
+    _max_concurrency: int
+    _compact: bool
+    _compress: bool
+
+    PAGE_SIZE = 100
+    CHECKPOINT_FOLDER = ".checkpoints"
+
+    def __init__(
+        self,
+        client: MobyGamesClient,
+        folder: str = EXCLUSIVES_FOLDER,
+        max_concurrency: int = 4,
+        compact: bool = False,
+        compress: bool = False,
+    ):
+        self._client = client
+        self._folder = folder
+        self._max_concurrency = max_concurrency
+        self._compact = compact
+        self._compress = compress
+
+    def __get_file_name_base(self, platform: Platform) -> str:
+        return Path(platform_to_file_name(platform.name)).stem
+
+    def __get_file_path(self, platform: Platform) -> str:
+        return f"{self._folder}/{self.__get_file_name_base(platform)}.json"
+
+    def __get_checkpoint_path(self, platform: Platform) -> str:
+        return (
+            f"{self._folder}/{self.CHECKPOINT_FOLDER}/"
+            f"{self.__get_file_name_base(platform)}"
+        )
 
-        if not os.path.exists("exclusives"):
-            os.mkdir("exclusives")
+    def __get_page_path(self, platform: Platform, offset: int) -> str:
+        return f"{self.__get_checkpoint_path(platform)}/{offset:07d}.json"
 
-        print(f"Writing {len(platform_exclusives)} exclusive games to {file_path}")
+    def __load_page(self, platform: Platform, offset: int) -> Dict[str, Any]:
+        with open(self.__get_page_path(platform, offset), "r", encoding="utf-8") as f:
+            return json.loads(f.read())
 
-        if not os.path.isfile(file_path):
-            with open(file_path, "w", encoding="utf-8"):
-                pass
+    def __get_page_offsets(self, platform: Platform) -> List[int]:
+        checkpoint_path = self.__get_checkpoint_path(platform)
 
-        with open(file_path, "r+", encoding="utf-8") as f:
-            f.write(
-                json.dumps(
-                    [g.__dict__ for g in platform_exclusives],
-                    sort_keys=True,
-                    indent=4,
-                    default=lambda c: (
-                        c.__dict__ if inspect.isclass(type(c)) else str(c)
+        if not os.path.isdir(checkpoint_path):
+            return []
+
+        return sorted(
+            int(Path(file).stem)
+            for file in os.listdir(checkpoint_path)
+            if file.endswith(".json")
+        )
+
+    def __get_resume_point(self, platform: Platform) -> Tuple[int, bool]:
+        offsets = self.__get_page_offsets(platform)
+
+        if not any(offsets):
+            return (0, False)
+
+        last_page = self.__load_page(platform, offsets[-1])
+
+        return (offsets[-1] + self.PAGE_SIZE, last_page["count"] < self.PAGE_SIZE)
+
+    async def crawl_platform(self, platform: Platform, semaphore: asyncio.Semaphore):
+        file_path = self.__get_file_path(platform)
+
+        if get_exclusives_file(file_path) is not None:
+            return
+
+        async with semaphore:
+            offset, done = self.__get_resume_point(platform)
+
+            if not done:
+                print(f"Requesting all games for {platform.name} from offset {offset}")
+                os.makedirs(self.__get_checkpoint_path(platform), exist_ok=True)
+
+            while not done:
+                games = await get_games(self._client, platform.id, offset)
+
+                write_atomic(
+                    self.__get_page_path(platform, offset),
+                    json.dumps(
+                        {
+                            "count": len(games),
+                            "games": [
+                                g.__dict__ for g in games if len(g.platforms) == 1
+                            ],
+                        },
+                        default=to_json_default,
                     ),
                 )
-            )
 
+                done = len(games) < self.PAGE_SIZE
+                offset += self.PAGE_SIZE
 
-async def find_exclusives_missing(platform: str):
-    cache_data = ExcelBackedCache().load("cache.pkl")
-    games = None
+        platform_exclusives = [
+            g
+            for page_offset in self.__get_page_offsets(platform)
+            for g in self.__load_page(platform, page_offset)["games"]
+        ]
+
+        # Platforms without exclusives keep their checkpoint so they're
+        # not requested again on the next crawl.
+        if not any(platform_exclusives):
+            return
+
+        file_path = write_exclusives(
+            file_path, platform_exclusives, self._compact, self._compress
+        )
+
+        print(f"Wrote {len(platform_exclusives)} exclusive games to {file_path}")
+
+        shutil.rmtree(self.__get_checkpoint_path(platform))
 
-    def to_enum_name(plat: str) -> str:
-        plat = plat.upper().strip().replace(" ", "_")
-        if str.isnumeric(plat[0]):
-            plat = f"_{plat}"
-        return plat
+    async def crawl(self):
+        platforms = await self._client.platforms()
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        os.makedirs(self._folder, exist_ok=True)
+
+        await asyncio.gather(
+            *(self.crawl_platform(platform, semaphore) for platform in platforms)
+        )
+
+
+async def find_all_exclusives(
+    max_concurrency: int = 4, compact: bool = False, compress: bool = False
+):
+    client = MobyGamesClient(MatchValidator(), rate_limit=RateLimit(1, DatePart.SECOND))
+
+    await ExclusivesCrawler(
+        client, max_concurrency=max_concurrency, compact=compact, compress=compress
+    ).crawl()
+
+
+def to_enum_name(plat: str) -> str:
+    plat = plat.upper().strip().replace(" ", "_")
+    if str.isnumeric(plat[0]):
+        plat = f"_{plat}"
+    return plat
+
+
+def load_sheet_games() -> List[ExcelGame]:
+    cache_data = ExcelBackedCache().load("cache.pkl")
 
     if cache_data is not None:
         games, _, _, _, _ = cache_data
-    else:
-        games = ExcelLoader().games
+        return games
+
+    return ExcelLoader().games
 
+
+def get_sheet_platform(
+    platform: str,
+) -> Optional[Set[ExcelPlatform] | ExcelPlatform]:
     platform = platform.lower().strip()
 
     if platform in MOBY_NAME_TO_SHEET_NAME or to_enum_name(platform) in [
         ep.name for ep in list(ExcelPlatform)
     ]:
-        sheet_platform = (
+        return (
             MOBY_NAME_TO_SHEET_NAME.get(platform)
             or ExcelPlatform[to_enum_name(platform)]
         )
-    else:
-        print(f"{platform} not found in MOBY_NAME_TO_SHEET_NAME")
-        sheet_platform = None
 
-    validator = MatchValidator()
-    platform_games = set(
-        validator.normalize(g.title)
-        for g in filter(
-            lambda g: (
-                (g.platform == sheet_platform)
-                if isinstance(sheet_platform, ExcelPlatform | None)
-                else (g.platform in sheet_platform)
-            ),
-            games,
+    return None
+
+
+def get_title_index(
+    games: List[ExcelGame], validator: MatchValidator
+) -> Dict[Optional[ExcelPlatform], Set[str]]:
+    index: Dict[Optional[ExcelPlatform], Set[str]] = {}
+
+    for g in games:
+        index.setdefault(g.platform, set()).add(validator.normalize(g.title))
+
+    return index
+
+
+def get_platform_titles(
+    index: Dict[Optional[ExcelPlatform], Set[str]],
+    sheet_platform: Optional[Set[ExcelPlatform] | ExcelPlatform],
+) -> Set[str]:
+    if isinstance(sheet_platform, ExcelPlatform | None):
+        return index.get(sheet_platform, set())
+
+    return set().union(*(index.get(p, set()) for p in sheet_platform))
+
+
+def is_missing_exclusive(
+    game: Game, platform_titles: Set[str], validator: MatchValidator
+) -> bool:
+    return (
+        not any(
+            gr.name in ("Gambling", "Racing / Driving", "Sports") for gr in game.genres
         )
+        and validator.normalize(game.title) not in platform_titles
     )
 
-    _exclusives = await find_exclusives(platform)
+
+async def find_exclusives_missing(platform: str):
+    sheet_platform = get_sheet_platform(platform)
+
+    if sheet_platform is None:
+        print(f"{platform.lower().strip()} not found in MOBY_NAME_TO_SHEET_NAME")
+
+    validator = MatchValidator()
+    platform_titles = get_platform_titles(
+        get_title_index(load_sheet_games(), validator), sheet_platform
+    )
+
+    _exclusives = await find_exclusives(platform.lower().strip())
 
     missing_exclusives = list(
         filter(
-            lambda g: not any(
-                gr.name in ("Gambling", "Racing / Driving", "Sports") for gr in g.genres
-            )
-            and validator.normalize(g.title) not in platform_games,
+            lambda g: is_missing_exclusive(g, platform_titles, validator),
             _exclusives,
         )
     )
@@ -399,30 +681,175 @@ async def find_exclusives_missing(platform: str):
     return missing_exclusives
 
 
-if __name__ == "__main__":
-    if len(sys.argv) == 1:
-        asyncio.run(find_all_exclusives())
-    else:
-        exclusives = asyncio.run(find_exclusives_missing(sys.argv[1]))
+def find_exclusives_missing_in_file(
+    file_path: str, platform_titles: Set[str]
+) -> List[Game]:
+    validator = MatchValidator()
+
+    return list(
+        filter(
+            lambda g: is_missing_exclusive(g, platform_titles, validator),
+            iter_exclusives(file_path),
+        )
+    )
+
+
+def find_all_exclusives_missing(
+    max_workers: Optional[int] = None,
+) -> List[Tuple[str, Game]]:
+    validator = MatchValidator()
+    index = get_title_index(load_sheet_games(), validator)
+
+    file_to_moby_name = {
+        platform_to_file_name(name): name for name in MOBY_NAME_TO_SHEET_NAME
+    }
+
+    platform_files: List[Tuple[str, str, Set[str]]] = []
+    skipped: List[str] = []
+
+    for entry in sorted(os.scandir(EXCLUSIVES_FOLDER), key=lambda e: e.name):
+        if not entry.is_file() or not (
+            entry.name.endswith(".json")
+            or entry.name.endswith(f".json{COMPRESSED_SUFFIX}")
+        ):
+            continue
+
+        file_path = f"{EXCLUSIVES_FOLDER}/{entry.name}"
+        base_path = file_path.removesuffix(COMPRESSED_SUFFIX)
+        platform = file_to_moby_name.get(base_path) or Path(base_path).stem
+        sheet_platform = get_sheet_platform(platform)
+
+        if sheet_platform is None:
+            skipped.append(platform)
+            continue
+
+        platform_files.append(
+            (platform, file_path, get_platform_titles(index, sheet_platform))
+        )
+
+    if any(skipped):
+        print(f"Skipping {len(skipped)} platforms without a sheet platform")
+
+    missing: List[Tuple[str, Game]] = []
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for (platform, _, _), platform_missing in zip(
+            platform_files,
+            executor.map(
+                find_exclusives_missing_in_file,
+                [file_path for _, file_path, _ in platform_files],
+                [titles for _, _, titles in platform_files],
+            ),
+        ):
+            missing.extend((platform, g) for g in platform_missing)
+
+    return missing
+
+
+def print_exclusives(exclusives: List[Tuple[Optional[str], Game]]):
+    print("")
+    for i, (platform, g) in enumerate(
+        sorted(
+            exclusives,
+            key=lambda pg: (-(pg[1].moby_score or 0), pg[1].title.casefold()),
+        )
+    ):
+        moby_score = (
+            f" - {g.moby_score}"
+            if g.moby_score is not None and g.moby_score > 0
+            else ""
+        )
+        platform_str = f" {{{platform}}}" if platform is not None else ""
+        print(
+            f"{g.title} [{g.platforms[0].first_release_date}] ({g.moby_url})"
+            f"{moby_score}{platform_str}"
+        )
+        if (i + 1) % 100 == 0:
+            input(f"{i + 1}/{len(exclusives)} listed. Press enter to continue.\n\n")
+
+
+@click.command()
+@click.argument("platform", required=False)
+@click.option(
+    "--all",
+    "-a",
+    "all_platforms",
+    type=bool,
+    default=False,
+    is_flag=True,
+    help="Ranks missing exclusives across every downloaded platform",
+)
+@click.option(
+    "--concurrency",
+    "-c",
+    type=int,
+    default=4,
+    help="Number of platforms crawled at once when no platform is given",
+)
+@click.option(
+    "--compact",
+    "-cp",
+    type=bool,
+    default=False,
+    is_flag=True,
+    help="Writes crawled exclusives with only the fields used by reports",
+)
+@click.option(
+    "--compress",
+    "-z",
+    type=bool,
+    default=False,
+    is_flag=True,
+    help="Gzips crawled or converted exclusives files",
+)
+@click.option(
+    "--convert",
+    type=bool,
+    default=False,
+    is_flag=True,
+    help="Rewrites existing exclusives files in the compact format",
+)
+@click.option(
+    "--workers",
+    "-w",
+    type=int,
+    default=None,
+    help="Number of worker processes used with --all",
+)
+def main(
+    platform: Optional[str],
+    all_platforms: bool,
+    concurrency: int,
+    compact: bool,
+    compress: bool,
+    convert: bool,
+    workers: Optional[int],
+):
+    if convert:
+        convert_exclusives(compress)
+        return
+
+    if all_platforms:
+        exclusives = find_all_exclusives_missing(workers)
 
         if not any(exclusives):
-            print(f"No exclusives for {sys.argv[1]}")
+            print("No missing exclusives")
         else:
-            print("")
-            for i, g in enumerate(
-                sorted(
-                    exclusives, key=lambda g: (-(g.moby_score or 0), g.title.casefold())
-                )
-            ):
-                moby_score = (
-                    f" - {g.moby_score}"
-                    if g.moby_score is not None and g.moby_score > 0
-                    else ""
-                )
-                print(
-                    f"{g.title} [{g.platforms[0].first_release_date}] ({g.moby_url}){moby_score}"
-                )
-                if (i + 1) % 100 == 0:
-                    input(
-                        f"{i + 1}/{len(exclusives)} listed. Press enter to continue.\n\n"
-                    )
+            print_exclusives(exclusives)
+        return
+
+    if platform is None:
+        asyncio.run(find_all_exclusives(concurrency, compact, compress))
+        return
+
+    exclusives = asyncio.run(find_exclusives_missing(platform))
+
+    if not any(exclusives):
+        print(f"No exclusives for {platform}")
+    else:
+        print_exclusives([(None, g) for g in exclusives])
+
+
+if __name__ == "__main__":
+    # pylint: disable=no-value-for-parameter
+    main()
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from collections import OrderedDict
 from typing import Any, Callable, Dict, List, Optional, Tuple
+import functools
+import heapq
 
 from excel_game import ExcelGame, ExcelPlatform
 from picked_game import PickedGame
@@ -97,6 +99,7 @@ class GameGrouping:
 
     _selection_sort: Optional[Callable[[PickedGame], Any]]
     _reverse_selection_sort: bool
+    _ranked: Dict[int, Tuple[List[PickedGame], List[PickedGame]]]
 
     def __init__(
         self,
@@ -132,13 +135,18 @@ class GameGrouping:
 
         self._selection_sort = None
         self._reverse_selection_sort = False
+        self._ranked = {}
 
-    def __default_grouping(self, g: ExcelGame):
+    @staticmethod
+    def get_platform_key(g: ExcelGame) -> ExcelPlatform | str:
         if g.platform == ExcelPlatform.PC and g.digital_platform is not None:
             return f"{g.platform} ({g.digital_platform})"
 
         return g.platform
 
+    def __default_grouping(self, g: ExcelGame):
+        return self.get_platform_key(g)
+
     def __get_default_sort(
         self, sort: Optional[Callable[[Tuple[Any, List[PickedGame]]], Any]]
     ) -> Callable[[Tuple[Any, List[PickedGame]]], Any]:
@@ -162,16 +170,9 @@ class GameGrouping:
         title = kvp[0]
         num_entries = min(len(kvp[1]), len(kvp[1][: self.group_size]))
 
-        games = kvp[1]
-
-        if self.group_size:
-            games = sorted(
-                games, key=self._selection_sort, reverse=self._reverse_selection_sort
-            )
+        games = self.ranked(kvp[1]) if self.group_size is not None else kvp[1]
 
-        total_playtime = sum(
-            g.game.estimated_playtime or 0 for g in games[: self.group_size]
-        )
+        total_playtime = sum(g.game.estimated_playtime or 0 for g in games)
 
         total_playtime_str = ""
 
@@ -210,6 +211,16 @@ class GameGrouping:
 
         return g2
 
+    def __elect_highest_priority(self, group: List[PickedGame]) -> PickedGame:
+        return functools.reduce(
+            lambda highest, g: (
+                g
+                if self.priority_determinator(g.game, highest.game) is g.game
+                else highest
+            ),
+            group,
+        )
+
     def __get_grouping(
         self, games: List[ExcelGame], by: Callable[[ExcelGame], Any]
     ) -> Dict[Any, List[PickedGame]]:
@@ -241,7 +252,37 @@ class GameGrouping:
             for key, _games in by_value.items()
         }
 
+    def ranked(self, group: List[PickedGame]) -> List[PickedGame]:
+        cached = self._ranked.get(id(group))
+
+        if cached is not None and cached[0] is group:
+            return cached[1]
+
+        if self.group_size is None or self.group_size >= len(group):
+            ranked = sorted(
+                group, key=self._selection_sort, reverse=self._reverse_selection_sort
+            )
+        elif self._reverse_selection_sort:
+            ranked = heapq.nlargest(self.group_size, group, key=self._selection_sort)
+        else:
+            ranked = heapq.nsmallest(self.group_size, group, key=self._selection_sort)
+
+        if (
+            self.group_size is not None
+            and self.should_rank
+            and any(ranked)
+            and not any(g.highest_priority for g in ranked)
+        ):
+            # The group's highest priority game was cut, so elect one from the rest
+            self.__elect_highest_priority(ranked).highest_priority = True
+
+        self._ranked[id(group)] = (group, ranked)
+        self._ranked[id(ranked)] = (ranked, ranked)
+
+        return ranked
+
     def get_groups(self, games: List[ExcelGame], _sorted: bool = True) -> GameGroups:
+        self._ranked = {}
         grouping = self.__get_grouping(games, by=self.grouping)
 
         return GameGroups(
@@ -261,8 +302,27 @@ class GameGrouping:
             )
         )
 
+    def get_config(self) -> Tuple[Any, ...]:
+        return (
+            self.grouping,
+            self.sort,
+            self.reverse,
+            self.get_group_name,
+            self.filter,
+            self.group_size,
+            self.custom_suffix,
+            self.progress_indicator,
+            self.priority_determinator,
+            self.should_rank,
+            tuple(sg.get_config() for sg in self.subgroupings),
+        )
+
     def set_selection_sort(
         self, sort: Optional[Callable[[PickedGame], Any]], reverse: bool
     ):
         self._selection_sort = sort
         self._reverse_selection_sort = reverse
+        self._ranked = {}
+
+        for subgrouping in self.subgroupings:
+            subgrouping.set_selection_sort(sort, reverse)
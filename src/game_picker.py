@@ -7,18 +7,19 @@ import random
 from difflib import SequenceMatcher, unified_diff
 from typing import List, Optional, Set, Tuple
 
-from excel_game import ExcelGame
+from excel_game import ExcelGame, ExcelPlatform
 
 from logging_decorator import LoggingColor, LoggingDecorator
 
 
 import picker_output
 from data_provider import DataProvider
-from excel_filter import ExcelFilter
+from excel_filter import FilterFlag
 from game_selector import GameSelector
 from picked_game import PickedGame
 from picker_constants import PLATFORM_SHORT_NAMES
 from picker_enums import PickerMode
+from selection_cache import SelectionCache
 from selector_library import SelectorLibrary
 
 
@@ -26,6 +27,7 @@ class GamesPicker:
     _data_provider: DataProvider
     _library: SelectorLibrary
     _mode: PickerMode
+    _selection_cache: SelectionCache
 
     __BASE_OUTPUT_PATH = "picker_out"
     __BASE_DROPBOX_FOLDER = "C:\\Users\\zachd\\Dropbox\\Video Game Lists"
@@ -35,17 +37,16 @@ class GamesPicker:
         self._no_cache = no_cache
         self._data_provider = DataProvider(self._no_cache)
         self._library = SelectorLibrary(self._data_provider, self._mode)
+        self._selection_cache = SelectionCache(self._data_provider)
 
     def __cleanup(self):
         files_to_remove = []
         expected_files = []
-        expected_cache_files = []
-
-        cache_folder = f"{GameSelector.CACHE_FOLDER}\\{self._mode.name.lower()}"
+        expected_cache_keys = []
 
         for selector in self.get_selectors():
             expected_files.append(selector.get_output_file_name())
-            expected_cache_files.append(selector.get_cache_file_name())
+            expected_cache_keys.append(selector.get_cache_key())
 
         for root, _, files in os.walk(picker_output.get_output_path(self._mode)):
             for file in files:
@@ -53,22 +54,22 @@ class GamesPicker:
                     files_to_remove.append(os.path.join(root, file))
             break
 
-        for root, _, files in os.walk(cache_folder):
-            for file in files:
-                if file not in expected_cache_files:
-                    files_to_remove.append(os.path.join(root, file))
-            break
-
         for file in files_to_remove:
             os.remove(file)
             print(f"Cleaned up {file}")
 
+        for cache_key in self._selection_cache.remove_stale(
+            self._mode, expected_cache_keys
+        ):
+            print(f"Cleaned up {cache_key} cache")
+
     def get_selectors(self) -> List[GameSelector]:
         selectors = self._library.all()
 
         for selector in selectors:
             selector.no_cache = self._no_cache
             selector.mode = self._mode
+            selector.selection_cache = self._selection_cache
 
         return sorted(
             list(filter(lambda s: s.enabled, selectors)),
@@ -88,10 +89,11 @@ class GamesPicker:
         no_diff: bool = False,
         force_picks: bool = False,
         markdown: bool = True,
+        platforms: Optional[Set[ExcelPlatform]] = None,
     ) -> Set[PickedGame]:
         picks: Set[PickedGame] = set([])
 
-        selection = selector.select(games)
+        selection = selector.select(games, platforms)
 
         full_path = picker_output.get_output_path(self._mode)
 
@@ -206,6 +208,20 @@ class GamesPicker:
 
         return picks
 
+    def __resolve_platforms(self, platform: str) -> Set[ExcelPlatform]:
+        platforms = set(
+            p
+            for p in ExcelPlatform
+            if self._data_provider.get_validator().titles_equal_normalized(
+                platform, p.value
+            )
+        )
+
+        if not any(platforms):
+            raise ValueError(f"Invalid platform {platform}")
+
+        return platforms
+
     def pick_game(
         self,
         selector_names: Optional[List[str]] = None,
@@ -218,17 +234,10 @@ class GamesPicker:
         if len(PLATFORM_SHORT_NAMES) != len(set(PLATFORM_SHORT_NAMES.values())):
             raise KeyError("Duplicate short name in PLATFORM_SHORT_NAMES")
 
-        unplayed = list(
-            filter(
-                lambda g: (
-                    platform is None
-                    or self._data_provider.get_validator().titles_equal_normalized(
-                        platform, g.platform.value
-                    )
-                )
-                and ExcelFilter.included_in_mode(g, self._mode),
-                self._data_provider.get_unplayed_candidates(),
-            )
+        platforms = self.__resolve_platforms(platform) if platform else None
+
+        unplayed = self._data_provider.get_games_with_flags(
+            FilterFlag.UNPLAYED_CANDIDATE, self._mode
         )
 
         picks: Set[PickedGame] = set()
@@ -247,9 +256,6 @@ class GamesPicker:
         for selector in selectors:
             should_skip = selector.skip_unless_specified
 
-            if platform:
-                selector.no_cache = True
-
             start = datetime.datetime.now()
 
             if force and not selector.no_force:
@@ -264,7 +270,12 @@ class GamesPicker:
 
             picks = picks.union(
                 self.run_selector(
-                    selector, unplayed, write_output, no_diff, markdown=markdown
+                    selector,
+                    unplayed,
+                    write_output,
+                    no_diff,
+                    markdown=markdown,
+                    platforms=platforms,
                 )
             )
 
@@ -274,6 +285,8 @@ class GamesPicker:
         if write_output:
             self.__cleanup()
 
+        self._selection_cache.flush()
+
         return random.choice(list(picks)) if any(picks) else None
 
     def search(self, title: str, p: int = 0) -> ExcelGame:
@@ -339,9 +352,10 @@ class GamesPicker:
     def completion(self, purchased_only: bool = False):
         incomplete_games = list(
             filter(
-                lambda g: ExcelFilter.included_in_mode(g, self._mode)
-                and (not purchased_only or (g.purchase_price or 0) > 0),
-                self._data_provider.get_unplayed_candidates(),
+                lambda g: not purchased_only or (g.purchase_price or 0) > 0,
+                self._data_provider.get_games_with_flags(
+                    FilterFlag.UNPLAYED_CANDIDATE, self._mode
+                ),
             )
         )
 
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-import os
 from typing import Any, Callable, List, Optional, Set
 
-from excel_game import ExcelGame
-from excel_backed_cache import ExcelBackedCache
+from excel_game import ExcelGame, ExcelPlatform
+from code_fingerprint import CodeFingerprint
 from game_grouping import GameGrouping, GameGroups
 from picked_game import PickedGame
 from picker_enums import PickerMode
+from selection_cache import SelectionCache
 
 
 class GameSelector:
@@ -30,10 +30,10 @@ class GameSelector:
     games: Optional[List[ExcelGame]]
     no_force: bool
     enabled: bool
+    selection_cache: SelectionCache
 
     _internal_sort: Optional[Callable[[PickedGame], Any]]
-    _cache: ExcelBackedCache
-    CACHE_FOLDER = "caches"
+    _fingerprint: Optional[str]
 
     def __init__(
         self,
@@ -87,7 +87,8 @@ class GameSelector:
         self.enabled = enabled
 
         self.grouping.set_selection_sort(self.sort, self.reverse_sort)
-        self._cache = ExcelBackedCache()
+        self.selection_cache = SelectionCache()
+        self._fingerprint = None
 
     def __get_sort(self) -> Callable[[PickedGame], Any]:
         def default_sort(g: PickedGame):
@@ -107,14 +108,42 @@ class GameSelector:
     def __default_prefix_suffix(self, _):
         return ""
 
-    def select(self, games: List[ExcelGame]) -> List[ExcelGame]:
+    def get_fingerprint(self) -> str:
+        if self._fingerprint is None:
+            fingerprint = CodeFingerprint()
+            fingerprint.update(
+                (
+                    self.selector,
+                    self.filter,
+                    self.run_on_modes,
+                    self.grouping.get_config(),
+                )
+            )
+            self._fingerprint = fingerprint.hexdigest()
+
+        return self._fingerprint
+
+    def select(
+        self,
+        games: List[ExcelGame],
+        platforms: Optional[Set[ExcelPlatform]] = None,
+    ) -> List[ExcelGame]:
         selection: Optional[List[ExcelGame]] = None
 
         if any(self.run_on_modes) and self.mode not in self.run_on_modes:
             return []
 
+        fingerprint = self.get_fingerprint()
+
+        # Restricted candidates are cached separately from the full selection
+        if platforms is not None and not self.games:
+            games = [g for g in games if g.platform in platforms]
+            fingerprint += ":" + ",".join(sorted(p.name for p in platforms))
+
         if not self.no_cache:
-            selection = self._cache.load(self.get_cache_full_path())
+            selection = self.selection_cache.load(
+                self.get_cache_key(), self.mode, fingerprint
+            )
 
         if selection is not None:
             return selection
@@ -127,7 +156,9 @@ class GameSelector:
             if self.selector is not None
             else self.games or games
         )
-        self.__write_cache(selection)
+        self.selection_cache.write(
+            self.get_cache_key(), self.mode, fingerprint, selection
+        )
 
         return selection
 
@@ -136,27 +167,7 @@ class GameSelector:
 
         if _sorted:
             for key, group in groups.items():
-                groups[key] = sorted(group, key=self.sort, reverse=self.reverse_sort)[
-                    : self.grouping.group_size
-                ]
-
-                if self.grouping.group_size is not None and self.grouping.should_rank:
-                    # May need to elect a new highest priority game
-                    highest: Optional[PickedGame] = None
-
-                    for g in groups[key]:
-                        if highest is None:
-                            highest = g
-                        elif g.highest_priority:
-                            highest = g
-                            break
-                        elif g.game.combined_rating > highest.game.combined_rating or (
-                            g.game.combined_rating == highest.game.combined_rating
-                            and g.game.normal_title > highest.game.normal_title
-                        ):
-                            highest = g
-
-                    highest.highest_priority = True
+                groups[key] = self.grouping.ranked(group)
 
         return groups
 
@@ -166,16 +177,5 @@ class GameSelector:
     def get_output_file_name(self) -> str:
         return f"{self.__get_file_name_base()}.txt"
 
-    def get_cache_file_name(self) -> str:
-        return f"cache-{self.__get_file_name_base()}.pkl"
-
-    def get_cache_full_path(self) -> str:
-        return f"{self.CACHE_FOLDER}\\{self.mode.name.lower()}\\{self.get_cache_file_name()}"
-
-    def __write_cache(self, selections: List[ExcelGame]):
-        if not os.path.exists(self.CACHE_FOLDER):
-            os.mkdir(self.CACHE_FOLDER)
-        if not os.path.exists(f"{self.CACHE_FOLDER}\\{self.mode.name.lower()}"):
-            os.mkdir(f"{self.CACHE_FOLDER}\\{self.mode.name.lower()}")
-
-        self._cache.write(self.get_cache_full_path(), selections)
+    def get_cache_key(self) -> str:
+        return self.__get_file_name_base()
@@ -65,6 +65,7 @@ from .progress.all_games import ALL_GAMES
 from .progress.challenge_selectors import (
     get_alphabetical_first_letter,
     get_one_per_criteria_challenge_selector,
+    get_one_per_criteria_challenge_selectors,
     get_platform_completion_id,
     get_playtime,
     get_top_developers,
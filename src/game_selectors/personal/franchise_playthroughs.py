@@ -3,7 +3,7 @@ from typing import List, Optional, Tuple
 from excel_game import ExcelGame
 
 from data_provider import DataProvider
-from excel_filter import ExcelFilter
+from excel_filter import FilterFlag
 from game_grouping import GameGrouping
 from game_selector import GameSelector
 from picker_enums import PickerMode
@@ -17,14 +17,8 @@ def franchise_playthroughs(
     by_franchise = GameGrouping(lambda g: g.franchise).get_groups(
         list(
             filter(
-                lambda g: g.franchise is not None
-                and ExcelFilter.included_in_mode(g, mode)
-                and ExcelFilter.is_not_low_priority(g)
-                and ExcelFilter.is_playable(g)
-                and ExcelFilter.is_playable_by_language(g)
-                and ExcelFilter.is_unplayed(g)
-                and ExcelFilter.is_released(g),
-                data_provider.get_games(),
+                lambda g: g.franchise is not None,
+                data_provider.get_games_with_flags(FilterFlag.UNPLAYED_CANDIDATE, mode),
             )
         ),
     )
@@ -61,25 +55,7 @@ def get_franchise_playthroughs_selector(
         lambda _: franchise_playthroughs(data_provider, mode, franchises),
         grouping=GameGrouping(
             lambda g: g.franchise,
-            progress_indicator=lambda kvp: (
-                len(
-                    list(
-                        filter(
-                            lambda g: g.franchise == kvp[0],
-                            data_provider.get_played_games(),
-                        )
-                    )
-                ),
-                len(
-                    list(
-                        filter(
-                            lambda g: g.franchise == kvp[0],
-                            data_provider.get_played_games()
-                            + data_provider.get_unplayed_candidates(),
-                        )
-                    )
-                ),
-            ),
+            progress_indicator=lambda kvp: data_provider.get_franchise_progress(kvp[0]),
         ),
         sort=lambda g: g.game.release_date,
         include_in_picks=False,
@@ -1,4 +1,4 @@
-from typing import Any, Callable, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Tuple
 import datetime
 
 from excel_game import ExcelGame, ExcelOwnedFormat, ExcelPlatform, ExcelRegion
@@ -11,39 +11,71 @@ from picker_enums import PickerMode
 CHALLENGE_START: datetime.datetime = datetime.datetime(2024, 10, 20)
 
 
+ARCADE_NOTES_BOARDS: Dict[str, str] = {
+    "Atomiswave": "Naomi",
+    "Naomi": "Naomi",
+    "Triforce": "Triforce",
+    "Chihiro": "Chihiro",
+    "System 573": "System 573",
+}
+
+# Platform -> (digital storefront, whether VR is called out)
+RETAIL_PLATFORMS: Dict[ExcelPlatform, Tuple[str, bool]] = {
+    ExcelPlatform.XBOX_360: ("XBLA", False),
+    ExcelPlatform.XBOX_ONE: ("Digital", False),
+    ExcelPlatform.XBOX_SERIES_X_S: ("Digital", False),
+    ExcelPlatform.PLAYSTATION_3: ("PSN", False),
+    ExcelPlatform.PLAYSTATION_4: ("PSN", True),
+    ExcelPlatform.PLAYSTATION_5: ("PSN", True),
+    ExcelPlatform.PLAYSTATION_VITA: ("PSN", False),
+    ExcelPlatform.NINTENDO_3DS: ("eShop", False),
+    ExcelPlatform.NEW_NINTENDO_3DS: ("eShop", False),
+    ExcelPlatform.NINTENDO_WII_U: ("eShop", False),
+    ExcelPlatform.NINTENDO_SWITCH: ("eShop", False),
+}
+
+# Checked only after a required accessory, which takes precedence for these
+RETAIL_PLATFORMS_AFTER_ACCESSORY: Dict[ExcelPlatform, Tuple[str, bool]] = {
+    ExcelPlatform.PLAYSTATION_PORTABLE: ("PSN", False),
+}
+
+
+def __get_retail_completion_id(game: ExcelGame, storefront: str, with_vr: bool) -> str:
+    vr_str = " (VR)" if with_vr and game.vr else ""
+
+    if game.owned_format in (ExcelOwnedFormat.BOTH, ExcelOwnedFormat.PHYSICAL):
+        return f"{game.platform.value}{vr_str} ({game.release_region.value} Retail)"
+    if game.owned_format == ExcelOwnedFormat.DIGITAL:
+        return f"{game.platform.value}{vr_str} ({storefront})"
+    return f"{game.platform.value}{vr_str} (Emulation)"
+
+
 def get_platform_completion_id(game: ExcelGame) -> str:
+    platform = game.platform.value
+
     # One Per PC / Playdate Subplatform
     if game.digital_platform is not None:
         vr = " (VR)" if game.vr else ""
         dlc = " (DLC)" if game.dlc else ""
-        return f"{game.platform.value} ({game.digital_platform}){vr}{dlc}"
+        return f"{platform} ({game.digital_platform}){vr}{dlc}"
 
-    # DLC
     if game.dlc:
-        return f"{game.platform.value} (DLC)"
+        return f"{platform} (DLC)"
 
     # MAME and Non-Mame
     if game.platform == ExcelPlatform.ARCADE:
         if game.physical_media_format == "LaserDisc":
-            return f"{game.platform.value} (LaserDisc)"
-        if game.notes in ("Atomiswave", "Naomi"):
-            return f"{game.platform.value} (Naomi)"
-        if game.notes == "Triforce":
-            return f"{game.platform.value} (Triforce)"
-        if game.notes == "Chihiro":
-            return f"{game.platform.value} (Chihiro)"
-        if game.notes == "System 573":
-            return f"{game.platform.value} (System 573)"
-        if game.mame_romset is not None:
-            return f"{game.platform.value} (MAME)"
-        return f"{game.platform.value} (Non-MAME)"
+            return f"{platform} (LaserDisc)"
+        if game.notes in ARCADE_NOTES_BOARDS:
+            return f"{platform} ({ARCADE_NOTES_BOARDS[game.notes]})"
+        return f"{platform} ({'MAME' if game.mame_romset is not None else 'Non-MAME'})"
 
     # Famicom / NES
     if game.platform == ExcelPlatform.NES:
         if game.release_region == ExcelRegion.JAPAN:
-            return f"{game.platform.value} (Famicom)"
+            return f"{platform} (Famicom)"
         if game.notes == "Bootleg":
-            return f"{game.platform.value} (Bootleg)"
+            return f"{platform} (Bootleg)"
 
     # Super Famicom / SNES / Nintendo Power
     if (
@@ -51,126 +83,30 @@ def get_platform_completion_id(game: ExcelGame) -> str:
         and game.release_region == ExcelRegion.JAPAN
         and game.required_accessory is None
     ):
-        return f"{game.platform.value} (Super Famicom)"
+        return f"{platform} (Super Famicom)"
 
     if game.subscription_service is not None:
         vr_str = " (VR)" if game.vr else ""
-        return f"{game.platform.value}{vr_str} ({game.subscription_service})"
-
-    # Digital / Retail Xbox 360 / XBLIG
-    if game.platform == ExcelPlatform.XBOX_360:
-        if game.owned_format in (ExcelOwnedFormat.BOTH, ExcelOwnedFormat.PHYSICAL):
-            return f"{game.platform.value} ({game.release_region.value} Retail)"
-        if game.owned_format == ExcelOwnedFormat.DIGITAL:
-            return f"{game.platform.value} (XBLA)"
-        return f"{game.platform.value} (Emulation)"
-
-    # Digital / Retail Xbox One
-    if game.platform == ExcelPlatform.XBOX_ONE:
-        if game.owned_format in (ExcelOwnedFormat.BOTH, ExcelOwnedFormat.PHYSICAL):
-            return f"{game.platform.value} ({game.release_region.value} Retail)"
-        if game.owned_format == ExcelOwnedFormat.DIGITAL:
-            return f"{game.platform.value} (Digital)"
-        return f"{game.platform.value} (Emulation)"
-
-    # Digital / Retail Xbox Series
-    if game.platform == ExcelPlatform.XBOX_SERIES_X_S:
-        if game.owned_format in (ExcelOwnedFormat.BOTH, ExcelOwnedFormat.PHYSICAL):
-            return f"{game.platform.value} ({game.release_region.value} Retail)"
-        if game.owned_format == ExcelOwnedFormat.DIGITAL:
-            return f"{game.platform.value} (Digital)"
-        return f"{game.platform.value} (Emulation)"
-
-    # Digital / Retail PS3
-    if game.platform == ExcelPlatform.PLAYSTATION_3:
-        if game.owned_format in (ExcelOwnedFormat.BOTH, ExcelOwnedFormat.PHYSICAL):
-            return f"{game.platform.value} ({game.release_region.value} Retail)"
-        if game.owned_format == ExcelOwnedFormat.DIGITAL:
-            return f"{game.platform.value} (PSN)"
-        return f"{game.platform.value} (Emulation)"
-
-    # Digital / Retail PS4
-    if game.platform == ExcelPlatform.PLAYSTATION_4:
-        vr_str = " (VR)" if game.vr else ""
-
-        if game.owned_format in (ExcelOwnedFormat.BOTH, ExcelOwnedFormat.PHYSICAL):
-            return f"{game.platform.value}{vr_str} ({game.release_region.value} Retail)"
-        if game.owned_format == ExcelOwnedFormat.DIGITAL:
-            return f"{game.platform.value}{vr_str} (PSN)"
-        return f"{game.platform.value}{vr_str} (Emulation)"
+        return f"{platform}{vr_str} ({game.subscription_service})"
 
-    # Digital / Retail PS5
-    if game.platform == ExcelPlatform.PLAYSTATION_5:
-        vr_str = " (VR)" if game.vr else ""
+    if game.platform in RETAIL_PLATFORMS:
+        return __get_retail_completion_id(game, *RETAIL_PLATFORMS[game.platform])
 
-        if game.owned_format in (ExcelOwnedFormat.BOTH, ExcelOwnedFormat.PHYSICAL):
-            return f"{game.platform.value}{vr_str} ({game.release_region.value} Retail)"
-        if game.owned_format == ExcelOwnedFormat.DIGITAL:
-            return f"{game.platform.value}{vr_str} (PSN)"
-        return f"{game.platform.value}{vr_str} (Emulation)"
-    # Digital / Retail Vita
-    if game.platform == ExcelPlatform.PLAYSTATION_VITA:
-        if game.owned_format in (ExcelOwnedFormat.BOTH, ExcelOwnedFormat.PHYSICAL):
-            return f"{game.platform.value} ({game.release_region.value} Retail)"
-        if game.owned_format == ExcelOwnedFormat.DIGITAL:
-            return f"{game.platform.value} (PSN)"
-        return f"{game.platform.value} (Emulation)"
-
-    # Virtual Console
-    if game.digital_platform == "Virtual Console":
-        return f"{game.platform.value} ({game.digital_platform})"
-
-    # Digital / Retail 3DS
-    if game.platform == ExcelPlatform.NINTENDO_3DS:
-        if game.owned_format in (ExcelOwnedFormat.BOTH, ExcelOwnedFormat.PHYSICAL):
-            return f"{game.platform.value} ({game.release_region.value} Retail)"
-        if game.owned_format == ExcelOwnedFormat.DIGITAL:
-            return f"{game.platform.value} (eShop)"
-        return f"{game.platform.value} (Emulation)"
-
-    # Digital / Retail New 3DS
-    if game.platform == ExcelPlatform.NEW_NINTENDO_3DS:
-        if game.owned_format in (ExcelOwnedFormat.BOTH, ExcelOwnedFormat.PHYSICAL):
-            return f"{game.platform.value} ({game.release_region.value} Retail)"
-        if game.owned_format == ExcelOwnedFormat.DIGITAL:
-            return f"{game.platform.value} (eShop)"
-        return f"{game.platform.value} (Emulation)"
-
-    # Digital / Retail Wii U
-    if game.platform == ExcelPlatform.NINTENDO_WII_U:
-        if game.owned_format in (ExcelOwnedFormat.BOTH, ExcelOwnedFormat.PHYSICAL):
-            return f"{game.platform.value} ({game.release_region.value} Retail)"
-        if game.owned_format == ExcelOwnedFormat.DIGITAL:
-            return f"{game.platform.value} (eShop)"
-        return f"{game.platform.value} (Emulation)"
-
-    # Digital / Retail Switch
-    if game.platform == ExcelPlatform.NINTENDO_SWITCH:
-        if game.owned_format in (ExcelOwnedFormat.BOTH, ExcelOwnedFormat.PHYSICAL):
-            return f"{game.platform.value} ({game.release_region.value} Retail)"
-        if game.owned_format == ExcelOwnedFormat.DIGITAL:
-            return f"{game.platform.value} (eShop)"
-        return f"{game.platform.value} (Emulation)"
-
-    # Any Required Accessory
     if game.required_accessory is not None:
-        return f"{game.platform.value} ({game.required_accessory})"
+        return f"{platform} ({game.required_accessory})"
 
-    # Digital / Retail PSP
-    if game.platform == ExcelPlatform.PLAYSTATION_PORTABLE:
-        if game.owned_format in (ExcelOwnedFormat.BOTH, ExcelOwnedFormat.PHYSICAL):
-            return f"{game.platform.value} ({game.release_region.value} Retail)"
-        if game.owned_format == ExcelOwnedFormat.DIGITAL:
-            return f"{game.platform.value} (PSN)"
-        return f"{game.platform.value} (Emulation)"
+    if game.platform in RETAIL_PLATFORMS_AFTER_ACCESSORY:
+        return __get_retail_completion_id(
+            game, *RETAIL_PLATFORMS_AFTER_ACCESSORY[game.platform]
+        )
 
     if not game.owned and game.platform not in (
         ExcelPlatform.PC,
         ExcelPlatform.BROWSER,
     ):
-        return f"{game.platform.value} (Emulation)"
+        return f"{platform} (Emulation)"
 
-    return game.platform.value
+    return platform
 
 
 def get_alphabetical_first_letter(game: ExcelGame) -> str:
@@ -215,30 +151,57 @@ def get_top_developers(games: List[ExcelGame], n: int = 50) -> Set[str]:
     )
 
 
-def one_per_criteria_challenge(
-    games: List[ExcelGame],
+class OnePerCriteriaKeys:
+    _keys: Dict[int, Tuple[ExcelGame, Any]]
+    completed_keys: Optional[Set[Any]]
+
+    def __init__(self):
+        self._keys = {}
+        self.completed_keys = None
+
+    def get(self, game: ExcelGame, grouping: Callable[[ExcelGame], Any]) -> Any:
+        cached = self._keys.get(id(game))
+
+        if cached is None or cached[0] is not game:
+            cached = (game, grouping(game))
+            self._keys[id(game)] = cached
+
+        return cached[1]
+
+
+class OnePerCriteriaChallenge(NamedTuple):
+    get_key: Callable[[ExcelGame], Any]
+    is_completed: Callable[[ExcelGame], bool]
+    get_remaining: Callable[[List[ExcelGame]], List[ExcelGame]]
+
+
+def get_one_per_criteria_challenge(
     data_provider: DataProvider,
     grouping: Callable[[ExcelGame], Any],
     challenge_start: datetime.datetime = CHALLENGE_START,
-) -> List[ExcelGame]:
-    remaining: List[ExcelGame] = []
-    grouped = GameGrouping(grouping).get_groups(games)
-
-    completed = set(
-        grouping(cg)
-        for cg in filter(
-            lambda cg: cg.date_completed is not None
-            and cg.date_completed.date() > challenge_start.date(),
-            data_provider.get_played_games(),
+) -> OnePerCriteriaChallenge:
+    keys = OnePerCriteriaKeys()
+
+    def get_key(game: ExcelGame) -> Any:
+        return keys.get(game, grouping)
+
+    def is_completed(game: ExcelGame) -> bool:
+        return (
+            game.date_completed is not None
+            and game.date_completed.date() > challenge_start.date()
         )
-    )
 
-    for item, group in grouped.items():
-        if item in completed:
-            continue
-        remaining.extend([pg.game for pg in group])
+    def get_remaining(games: List[ExcelGame]) -> List[ExcelGame]:
+        if keys.completed_keys is None:
+            keys.completed_keys = set(
+                get_key(cg)
+                for cg in data_provider.get_played_games()
+                if is_completed(cg)
+            )
+
+        return [g for g in games if get_key(g) not in keys.completed_keys]
 
-    return remaining
+    return OnePerCriteriaChallenge(get_key, is_completed, get_remaining)
 
 
 def get_one_per_criteria_challenge_selector(
@@ -253,6 +216,7 @@ def get_one_per_criteria_challenge_selector(
         Callable[[Tuple[Any, List[PickedGame]]], Any]
     ] = None,
     custom_grouping_sort_reverse: bool = False,
+    challenge: Optional[OnePerCriteriaChallenge] = None,
 ) -> GameSelector:
     name = f"One Per {criteria_name.title()} Challenge"
 
@@ -262,22 +226,16 @@ def get_one_per_criteria_challenge_selector(
     if completions:
         name += " Completions"
 
+    if challenge is None:
+        challenge = get_one_per_criteria_challenge(
+            data_provider, grouping, challenge_start
+        )
+
     def select(games: List[ExcelGame]) -> List[ExcelGame]:
         if completions:
-            return list(
-                cg
-                for cg in filter(
-                    lambda cg: cg.date_completed is not None
-                    and cg.date_completed.date() > challenge_start.date(),
-                    games,
-                )
-            )
-
-        selected = one_per_criteria_challenge(
-            games, data_provider, grouping, challenge_start
-        )
+            return list(filter(challenge.is_completed, games))
 
-        return selected
+        return challenge.get_remaining(games)
 
     def get_description(groups: GameGroups, completions: bool) -> str:
         rem_or_completed = "Remaining to Complete" if not completions else "Completed"
@@ -297,7 +255,7 @@ def get_one_per_criteria_challenge_selector(
         run_on_modes=set([PickerMode.ALL]),
         include_in_picks=False,
         grouping=GameGrouping(
-            grouping,
+            challenge.get_key,
             group_size=5 if not completions else 1,
             should_rank=not completions,
             sort=custom_grouping_sort,
@@ -312,3 +270,54 @@ def get_one_per_criteria_challenge_selector(
         name=name,
         games=games_override,
     )
+
+
+def get_one_per_criteria_challenge_selectors(
+    criteria_name: str,
+    data_provider: DataProvider,
+    grouping: Callable[[ExcelGame], Any],
+    _filter: Optional[Callable[[ExcelGame], bool]] = None,
+    completions_filter: Optional[Callable[[ExcelGame], bool]] = None,
+    challenge_start: datetime.datetime = CHALLENGE_START,
+    custom_grouping_sort: Optional[
+        Callable[[Tuple[Any, List[PickedGame]]], Any]
+    ] = None,
+    custom_grouping_sort_reverse: bool = False,
+    completions_grouping_sort: Optional[
+        Callable[[Tuple[Any, List[PickedGame]]], Any]
+    ] = None,
+) -> Tuple[GameSelector, GameSelector]:
+    challenge = get_one_per_criteria_challenge(data_provider, grouping, challenge_start)
+    completions_filter = completions_filter or _filter
+
+    return (
+        get_one_per_criteria_challenge_selector(
+            criteria_name,
+            data_provider,
+            grouping,
+            games_override=(
+                list(filter(_filter, data_provider.get_unplayed_candidates()))
+                if _filter is not None
+                else None
+            ),
+            challenge_start=challenge_start,
+            custom_grouping_sort=custom_grouping_sort,
+            custom_grouping_sort_reverse=custom_grouping_sort_reverse,
+            challenge=challenge,
+        ),
+        get_one_per_criteria_challenge_selector(
+            criteria_name,
+            data_provider,
+            grouping,
+            games_override=(
+                list(filter(completions_filter, data_provider.get_played_games()))
+                if completions_filter is not None
+                else data_provider.get_played_games()
+            ),
+            completions=True,
+            challenge_start=challenge_start,
+            custom_grouping_sort=completions_grouping_sort or custom_grouping_sort,
+            custom_grouping_sort_reverse=custom_grouping_sort_reverse,
+            challenge=challenge,
+        ),
+    )
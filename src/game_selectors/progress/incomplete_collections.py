@@ -6,15 +6,7 @@ from picker_enums import PickerMode
 
 
 def incomplete_collections(data_provider: DataProvider) -> List[ExcelGame]:
-    games, _ = data_provider.get_excel_loader().merge()
-
-    incomplete: List[ExcelGame] = []
-
-    for g in games:
-        if any(g.child_games) and not g.completed:
-            incomplete.append(g)
-
-    return incomplete
+    return list(filter(lambda g: not g.completed, data_provider.get_collections()))
 
 
 def get_incomplete_collections_selector(data_provider: DataProvider) -> GameSelector:
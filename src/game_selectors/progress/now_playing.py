@@ -1,7 +1,7 @@
 import datetime
 
 from data_provider import DataProvider
-from excel_filter import ExcelFilter
+from excel_filter import FilterFlag
 from game_grouping import GameGrouping
 from game_selector import GameSelector
 from picker_enums import PickerMode
@@ -13,9 +13,8 @@ def get_now_playing_selector(
     return GameSelector(
         lambda _: list(
             filter(
-                lambda g: ExcelFilter.included_in_mode(g, mode)
-                and g.playing_status is not None,
-                data_provider.get_games(),
+                lambda g: g.playing_status is not None,
+                data_provider.get_games_with_flags(FilterFlag(0), mode),
             )
         ),
         grouping=GameGrouping(
@@ -1,66 +1,32 @@
-from typing import Dict, List, Set
-import datetime
+from typing import List
 
 from excel_game import ExcelGame
 from data_provider import DataProvider
 from game_grouping import GameGrouping
 from game_selector import GameSelector
 from picker_enums import PickerMode
+from timeline import Timeline
 
-
-class PlaythroughPoint:
-    date: datetime.datetime
-    game: ExcelGame
-    end: bool
-
-    def __init__(self, game: ExcelGame, date: datetime.datetime, end: bool):
-        self.game = game
-        self.date = date
-        self.end = end
+MOST_CONCURRENT_DATE_COUNT = 50
 
 
 def get_playthrough_days(
     games: List[ExcelGame],
 ) -> List[ExcelGame]:
-    dates: List[PlaythroughPoint] = []
-    concurrent: Set[ExcelGame] = set()
-    concurrent_games: Dict[datetime.datetime, Set[ExcelGame]] = {}
-
-    for game in games:
-        if game.date_started is not None:
-            dates.append(PlaythroughPoint(game, game.date_started, False))
-        if game.date_completed is not None:
-            dates.append(PlaythroughPoint(game, game.date_completed, True))
-
-    dates.sort(key=lambda x: (x.date, x.end))
-
-    for point in dates:
-        point_games: Set[ExcelGame] = set()
-
-        if point.end:
-            if point.game in concurrent:
-                concurrent.remove(point.game)
-            else:
-                point_games.add(point.game)
-        else:
-            if (
-                point.game.date_completed is not None
-                or point.game.playing_status is not None
-            ):
-                concurrent.add(point.game)
-            else:
-                point_games.add(point.game)
-
-        date_games = set(
-            g.get_copy_with_metadata(point.date) for g in concurrent.union(point_games)
-        )
-
-        if point.date in concurrent_games:
-            concurrent_games[point.date].update(date_games)
-        else:
-            concurrent_games[point.date] = date_games
+    timeline = Timeline(
+        games,
+        lambda g: g.date_started,
+        lambda g: g.date_completed,
+        opens=lambda g: g.date_completed is not None or g.playing_status is not None,
+    )
 
-    return [game for games in concurrent_games.values() for game in games]
+    return [
+        g.get_copy_with_metadata(date)
+        for date, date_games in timeline.get_most_concurrent(
+            MOST_CONCURRENT_DATE_COUNT
+        ).items()
+        for g in date_games
+    ]
 
 
 def get_most_concurrent_playthroughs_selector(
@@ -98,5 +64,5 @@ def get_most_concurrent_playthroughs_selector(
                 else (" Ongoing" if g.playing_status is not None else "")
             )
         ),
-        group_count=50,
+        group_count=MOST_CONCURRENT_DATE_COUNT,
     )
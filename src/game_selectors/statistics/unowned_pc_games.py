@@ -1,6 +1,6 @@
 from excel_game import ExcelPlatform
 from data_provider import DataProvider
-from excel_filter import ExcelFilter
+from excel_filter import FilterFlag
 from game_grouping import GameGrouping
 from game_selector import GameSelector
 from picker_enums import PickerMode
@@ -10,14 +10,15 @@ def get_unowned_pc_games_selector(data_provider: DataProvider) -> GameSelector:
     return GameSelector(
         lambda _: list(
             filter(
-                lambda g: ExcelFilter.is_not_low_priority(g)
-                and ExcelFilter.is_playable_by_language(g)
-                and ExcelFilter.is_released(g)
-                and ExcelFilter.is_unplayed(g)
-                and g.platform == ExcelPlatform.PC
+                lambda g: g.platform == ExcelPlatform.PC
                 and not g.owned
                 and g.notes != "Freeware",
-                data_provider.get_games(),
+                data_provider.get_games_with_flags(
+                    FilterFlag.NOT_LOW_PRIORITY
+                    | FilterFlag.PLAYABLE_BY_LANGUAGE
+                    | FilterFlag.RELEASED
+                    | FilterFlag.UNPLAYED
+                ),
             )
         ),
         name="Unowned PC Games",
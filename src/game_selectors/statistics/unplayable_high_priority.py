@@ -1,7 +1,7 @@
 from excel_game import Playability
 
 from data_provider import DataProvider
-from excel_filter import ExcelFilter
+from excel_filter import FilterFlag
 from game_selector import GameSelector
 from picker_enums import PickerMode
 
@@ -12,11 +12,8 @@ def get_unplayable_high_priority_selector(
     return GameSelector(
         lambda _: list(
             filter(
-                lambda g: g.playability != Playability.PLAYABLE
-                and not g.completed
-                and g.priority >= 3
-                and ExcelFilter.included_in_mode(g, mode),
-                data_provider.get_games(),
+                lambda g: g.playability != Playability.PLAYABLE and g.priority >= 3,
+                data_provider.get_games_with_flags(FilterFlag.UNPLAYED, mode),
             )
         ),
         name="Unplayable High Priority",
@@ -1,50 +1,149 @@
-from typing import List, Set
+from typing import Dict, Iterable, List, Optional, Set
+import hashlib
 import re
 
 from spellchecker import SpellChecker
 
 from excel_game import ExcelGame
+from excel_backed_cache import ExcelBackedCache
 from game_grouping import GameGrouping
 from game_selector import GameSelector
 from picker_enums import PickerMode
 
+NON_WORD_PATTERN = re.compile(r"[^A-Za-z0-9\s]")
+COMPOUND_PATTERN = re.compile(r"[A-Z][^A-Z]*")
+
+
+class SpellingVerdicts:
+    __CACHE_FILE_NAME = "spellcache.pkl"
+    __DICTIONARY_FILE_NAME = "dictionary.txt"
+
+    _cache: ExcelBackedCache
+    _checker: Optional[SpellChecker]
+    _dictionary_hash: Optional[str]
+    _unknown: Dict[str, bool]
+    _correctable: Dict[str, bool]
+    _changed: bool
+
+    def __init__(self):
+        self._cache = ExcelBackedCache()
+        self._checker = None
+        self._dictionary_hash = None
+        self._unknown = {}
+        self._correctable = {}
+        self._changed = False
+
+    def load(self):
+        with open(self.__DICTIONARY_FILE_NAME, "rb") as f:
+            dictionary_hash = hashlib.sha256(f.read()).hexdigest()
+
+        if dictionary_hash == self._dictionary_hash:
+            return
+
+        self._checker = None
+        self._dictionary_hash = dictionary_hash
+        self._unknown = {}
+        self._correctable = {}
+        self._changed = False
+
+        cached = self._cache.load(self.__CACHE_FILE_NAME, use_excel_modify_date=False)
+
+        if cached is not None and cached[0] == dictionary_hash:
+            _, self._unknown, self._correctable = cached
+
+    def save(self):
+        if self._changed:
+            self._cache.write(
+                self.__CACHE_FILE_NAME,
+                (self._dictionary_hash, self._unknown, self._correctable),
+            )
+            self._changed = False
+
+    def __get_checker(self) -> SpellChecker:
+        if self._checker is None:
+            self._checker = SpellChecker()
+            self._checker.word_frequency.load_text_file(self.__DICTIONARY_FILE_NAME)
+
+        return self._checker
+
+    def resolve(self, words: Iterable[str]):
+        pending = set(w.lower() for w in words).difference(self._unknown)
+
+        if any(pending):
+            unknown = self.__get_checker().unknown(pending)
+
+            for word in pending:
+                self._unknown[word] = word in unknown
+
+            self._changed = True
+
+    def is_unknown(self, word: str) -> bool:
+        return self._unknown[word.lower()]
+
+    def is_misspelled(self, word: str) -> bool:
+        word = word.lower()
+
+        if not self._unknown[word]:
+            return False
+
+        correctable = self._correctable.get(word)
+
+        if correctable is None:
+            correctable = self.__get_checker().correction(word) is not None
+            self._correctable[word] = correctable
+            self._changed = True
+
+        return correctable
+
+
+SPELLING_VERDICTS = SpellingVerdicts()
+
 
 def misspellings(games: List[ExcelGame]) -> List[ExcelGame]:
     misspelled = []
-    checker = SpellChecker()
-    checker.word_frequency.load_text_file("dictionary.txt")
+    verdicts = SPELLING_VERDICTS
+    verdicts.load()
+
+    title_words = [
+        [NON_WORD_PATTERN.sub("", word).strip() for word in game.title.split()]
+        for game in games
+    ]
+
+    verdicts.resolve(
+        word
+        for words in title_words
+        for word in words
+        if any(word) and any(COMPOUND_PATTERN.findall(word))
+    )
 
-    def get_words(t: str) -> Set[str]:
-        words = t.split()
+    def get_words(words: List[str]) -> Set[str]:
         output_words = set()
 
         for word in words:
-            word = re.sub(r"[^A-Za-z0-9\s]", "", word).strip()
-            compound = re.findall(r"[A-Z][^A-Z]*", word)
+            compound = COMPOUND_PATTERN.findall(word)
 
             if any(compound):
-                if not any(checker.unknown([word])):
+                if not verdicts.is_unknown(word):
                     continue
-                output_words = output_words.union(set(compound))
+                output_words.update(compound)
                 continue
 
             output_words.add(word)
 
         return output_words.difference(set([""]))
 
-    all_misspelled_words = set([])
+    game_words = [get_words(words) for words in title_words]
+    verdicts.resolve(word for words in game_words for word in words)
 
-    for game in games:
-        title_words = get_words(game.title)
-        misspelled_words = checker.unknown(title_words)
-        all_misspelled_words = all_misspelled_words.union(set(misspelled_words))
-
-        for word in misspelled_words:
-            if checker.correction(word) is not None:
-                print(f"Found a misspelled word {word} for {game.full_name}")
+    for game, words in zip(games, game_words):
+        for word in words:
+            if verdicts.is_misspelled(word):
+                print(f"Found a misspelled word {word.lower()} for {game.full_name}")
                 misspelled.append(game)
                 break
 
+    verdicts.save()
+
     return misspelled
 
 
@@ -1,5 +1,5 @@
-from typing import List, Set
-import copy
+from enum import Enum
+from typing import Callable, Dict, List, NamedTuple, Set, Tuple
 import datetime
 import re
 import statistics
@@ -10,278 +10,354 @@ from game_grouping import GameGrouping
 from game_selector import GameSelector
 from picker_enums import PickerMode
 
+DOUBLE_SPACE_PATTERN = re.compile(r"[ ]{2,}")
+
+
+class RuleSource(Enum):
+    GAMES = 1
+    COMPLETED = 2
+    GAMES_ON_ORDER = 3
+    COLLECTIONS = 4
+
+
+class ValidationContext(NamedTuple):
+    all_titles: Set[str]
+    games_dict: Dict[str, ExcelGame]
+    order_hash_dict: Dict[str, ExcelGame]
+    today: datetime.date
+
+
+class ValidationRule(NamedTuple):
+    source: RuleSource
+    name: str
+    is_invalid: Callable[[ExcelGame, int, ValidationContext], bool]
+
+
+VALIDATION_RULES: List[ValidationRule] = []
+
+
+def validation_rule(source: RuleSource, name: str):
+    def register(
+        is_invalid: Callable[[ExcelGame, int, ValidationContext], bool],
+    ) -> Callable[[ExcelGame, int, ValidationContext], bool]:
+        VALIDATION_RULES.append(ValidationRule(source, name, is_invalid))
+        return is_invalid
+
+    return register
+
+
+def round_to_2(num: float) -> float:
+    return float(f"{num:,.2f}")
+
+
+def to_percent(num: float) -> int:
+    return round(num * 100)
+
+
+def has_double_spaces(value: str) -> bool:
+    return DOUBLE_SPACE_PATTERN.search(value) is not None
+
+
+@validation_rule(RuleSource.GAMES, "Missing Condition")
+def _missing_condition(game: ExcelGame, _: int, __: ValidationContext) -> bool:
+    return (
+        game.owned
+        and game.owned_format in (ExcelOwnedFormat.PHYSICAL, ExcelOwnedFormat.BOTH)
+        and game.owned_condition is None
+    )
+
+
+@validation_rule(RuleSource.GAMES, "Missing Format")
+def _missing_format(game: ExcelGame, _: int, __: ValidationContext) -> bool:
+    return game.owned and (game.owned_format is None or game.owned == "")
+
+
+@validation_rule(RuleSource.GAMES, "Lingering Metadata")
+def _lingering_metadata(game: ExcelGame, _: int, __: ValidationContext) -> bool:
+    return game.completed and (
+        game.estimated_playtime is not None or game.priority is not None
+    )
+
+
+@validation_rule(RuleSource.GAMES, "Wishlisted and Owned")
+def _wishlisted_and_owned(game: ExcelGame, _: int, __: ValidationContext) -> bool:
+    return game.owned and game.wishlisted
+
+
+@validation_rule(RuleSource.GAMES, "Missing Rating")
+def _missing_rating(game: ExcelGame, _: int, __: ValidationContext) -> bool:
+    return game.completed and game.rating is None
+
+
+@validation_rule(RuleSource.GAMES, "Missing PC Subplatform")
+def _missing_pc_subplatform(game: ExcelGame, _: int, __: ValidationContext) -> bool:
+    return (
+        game.owned
+        and game.platform == ExcelPlatform.PC
+        and (game.notes is None or game.notes == "")
+    )
+
+
+@validation_rule(RuleSource.GAMES, "Unowned With Ownership Metadata")
+def _unowned_with_ownership_metadata(
+    game: ExcelGame, _: int, __: ValidationContext
+) -> bool:
+    return not game.owned and (
+        game.owned_condition is not None
+        or (game.date_purchased is not None and game.date_purchased != "")
+        or (game.purchase_price is not None and game.purchase_price != "")
+        or (game.owned_format is not None and game.owned_format != "")
+    )
+
+
+@validation_rule(RuleSource.GAMES, "Browser Games Without Links")
+def _browser_games_without_links(
+    game: ExcelGame, _: int, __: ValidationContext
+) -> bool:
+    return (
+        not game.completed
+        and game.platform == ExcelPlatform.BROWSER
+        and game.notes
+        not in (
+            "Link",
+            "itch.io",
+        )
+    )
+
+
+@validation_rule(RuleSource.GAMES, "Missing Translation Info")
+def _missing_translation_info(game: ExcelGame, _: int, __: ValidationContext) -> bool:
+    return (
+        game.release_region
+        not in (
+            ExcelRegion.EUROPE,
+            ExcelRegion.NORTH_AMERICA,
+            ExcelRegion.AUSTRALIA,
+        )
+        and game.translation is None
+    )
+
+
+@validation_rule(RuleSource.GAMES, "Estimated Playtime Using Incorrect Multiple")
+def _estimated_playtime_multiple(
+    game: ExcelGame, _: int, __: ValidationContext
+) -> bool:
+    return (
+        game.estimated_playtime is not None
+        and game.estimated_playtime > 1
+        and game.estimated_playtime != 0.5 * round(game.estimated_playtime / 0.5)
+    )
+
+
+@validation_rule(RuleSource.GAMES, "Trailing Whitespace")
+def _trailing_whitespace(game: ExcelGame, _: int, __: ValidationContext) -> bool:
+    return (
+        game.title != game.title.strip()
+        or game.publisher != game.publisher.strip()
+        or game.developer != game.developer.strip()
+        or (game.franchise is not None and game.franchise != game.franchise.strip())
+    )
+
+
+@validation_rule(RuleSource.GAMES, "Double Spaces")
+def _double_spaces(game: ExcelGame, _: int, __: ValidationContext) -> bool:
+    return (
+        has_double_spaces(game.title)
+        or has_double_spaces(game.publisher)
+        or has_double_spaces(game.developer)
+        or (game.franchise is not None and has_double_spaces(game.franchise))
+    )
+
+
+@validation_rule(RuleSource.GAMES, "Start Date After Completed Date")
+def _start_after_completed(game: ExcelGame, _: int, __: ValidationContext) -> bool:
+    return (
+        game.date_started is not None
+        and game.date_completed is not None
+        and game.date_started > game.date_completed
+    )
+
+
+@validation_rule(RuleSource.COMPLETED, "Completed: Collection Mismatch")
+def _collection_mismatch(game: ExcelGame, _: int, context: ValidationContext) -> bool:
+    return (
+        game.collection is not None
+        and game.collection != ""
+        and game.collection not in context.all_titles
+    )
+
+
+@validation_rule(RuleSource.COMPLETED, "Completed: Completion Number Incorrect")
+def _completion_number_incorrect(
+    game: ExcelGame, index: int, _: ValidationContext
+) -> bool:
+    return game.completion_number != index + 1
+
+
+@validation_rule(RuleSource.COMPLETED, "Completed: Rating Mismatch")
+def _rating_mismatch(game: ExcelGame, _: int, context: ValidationContext) -> bool:
+    sheet_game = context.games_dict.get(game.hash_id)
+    return sheet_game is not None and to_percent(game.rating) != to_percent(
+        sheet_game.rating or 0
+    )
+
+
+@validation_rule(RuleSource.COMPLETED, "Completed: Completion Time Mismatch")
+def _completion_time_mismatch(
+    game: ExcelGame, _: int, context: ValidationContext
+) -> bool:
+    sheet_game = context.games_dict.get(game.hash_id)
+    return sheet_game is not None and round_to_2(
+        game.completion_time or 0
+    ) != round_to_2(sheet_game.completion_time or 0)
+
+
+@validation_rule(RuleSource.COMPLETED, "Completed: Completed Date Mismatch")
+def _completed_date_mismatch(
+    game: ExcelGame, _: int, context: ValidationContext
+) -> bool:
+    sheet_game = context.games_dict.get(game.hash_id)
+    return sheet_game is not None and game.date_completed != sheet_game.date_completed
+
+
+@validation_rule(RuleSource.COMPLETED, "Completed: Completed Start Date Mismatch")
+def _started_date_mismatch(game: ExcelGame, _: int, context: ValidationContext) -> bool:
+    sheet_game = context.games_dict.get(game.hash_id)
+    return sheet_game is not None and game.date_started != sheet_game.date_started
+
+
+@validation_rule(RuleSource.COMPLETED, "Completed: VR Metadata Mismatch")
+def _vr_metadata_mismatch(game: ExcelGame, _: int, context: ValidationContext) -> bool:
+    sheet_game = context.games_dict.get(game.hash_id)
+    return sheet_game is not None and game.played_in_vr and not sheet_game.vr
+
+
+@validation_rule(RuleSource.GAMES_ON_ORDER, "Games on Order: Past Estimated Release")
+def _past_estimated_release(
+    game: ExcelGame, _: int, context: ValidationContext
+) -> bool:
+    return (
+        game.estimated_release is not None
+        and game.estimated_release.date() < context.today
+    )
+
+
+@validation_rule(
+    RuleSource.GAMES_ON_ORDER, "Games on Order: Not Removed From Order Sheet"
+)
+def _not_removed_from_order_sheet(
+    game: ExcelGame, _: int, context: ValidationContext
+) -> bool:
+    return game.game_order_hash_id in context.order_hash_dict
+
+
+@validation_rule(
+    RuleSource.COLLECTIONS, "Completed: Collection Completion Time Mismatch"
+)
+def _collection_completion_time_mismatch(
+    game: ExcelGame, _: int, context: ValidationContext
+) -> bool:
+    return round_to_2(sum(g.completion_time or 0 for g in game.child_games)) > (
+        round_to_2(context.games_dict[game.hash_id].completion_time or 0)
+    )
+
+
+@validation_rule(RuleSource.COLLECTIONS, "Completed: Collection Rating Mismatch")
+def _collection_rating_mismatch(
+    game: ExcelGame, _: int, context: ValidationContext
+) -> bool:
+    return to_percent(statistics.mean(g.rating for g in game.child_games)) != (
+        to_percent(context.games_dict[game.hash_id].rating or 0)
+    )
+
+
+@validation_rule(
+    RuleSource.COLLECTIONS, "Completed: Collection Completed Date Mismatch"
+)
+def _collection_completed_date_mismatch(
+    game: ExcelGame, _: int, context: ValidationContext
+) -> bool:
+    sheet_game = context.games_dict[game.hash_id]
+
+    if not sheet_game.completed:
+        return False
+
+    completed_dates = [
+        g.date_completed for g in game.child_games if g.date_completed is not None
+    ]
+
+    return any(completed_dates) and sheet_game.date_completed != max(completed_dates)
+
+
+def evaluate_rules(
+    source: RuleSource, games: List[ExcelGame], context: ValidationContext
+) -> List[Tuple[int, int]]:
+    rules = [
+        (rule_id, rule)
+        for rule_id, rule in enumerate(VALIDATION_RULES)
+        if rule.source == source
+    ]
+
+    return [
+        (index, rule_id)
+        for index, game in enumerate(games)
+        for rule_id, rule in rules
+        if rule.is_invalid(game, index, context)
+    ]
+
+
+def materialize_violations(
+    games: List[ExcelGame], violations: List[Tuple[int, int]]
+) -> List[ExcelGame]:
+    # A game can break several rules and lands in one group per rule, so each
+    # violation still needs its own copy to carry the rule name.
+    return [
+        games[index].get_copy_with_metadata(VALIDATION_RULES[rule_id].name)
+        for index, rule_id in violations
+    ]
+
 
 def sheet_validations(
     games: List[ExcelGame], data_provider: DataProvider
 ) -> List[ExcelGame]:
-    invalid_games: List[ExcelGame] = []
-    all_titles: Set[str] = set([])
-
-    for game in games:
-        all_titles.add(game.title)
-
-        # Owned Physical Games Missing Condition
-        if (
-            game.owned
-            and game.owned_format in (ExcelOwnedFormat.PHYSICAL, ExcelOwnedFormat.BOTH)
-            and game.owned_condition is None
-        ):
-            g_copy = copy.copy(game)
-            g_copy.group_metadata = "Missing Condition"
-            invalid_games.append(g_copy)
-
-        # Owned Games Missing Format
-        if game.owned and (game.owned_format is None or game.owned == ""):
-            g_copy = copy.copy(game)
-            g_copy.group_metadata = "Missing Format"
-            invalid_games.append(g_copy)
-
-        # Completed Games with Lingering Metadata
-        if game.completed and (
-            game.estimated_playtime is not None or game.priority is not None
-        ):
-            g_copy = copy.copy(game)
-            g_copy.group_metadata = "Lingering Metadata"
-            invalid_games.append(g_copy)
-
-        # Wishlisted and Owned
-        if game.owned and game.wishlisted:
-            g_copy = copy.copy(game)
-            g_copy.group_metadata = "Wishlisted and Owned"
-            invalid_games.append(g_copy)
-
-        # Missing Rating
-        if game.completed and game.rating is None:
-            g_copy = copy.copy(game)
-            g_copy.group_metadata = "Missing Rating"
-            invalid_games.append(g_copy)
-
-        # Owned PC Game Missing Subplatform
-        if (
-            game.owned
-            and game.platform == ExcelPlatform.PC
-            and (game.notes is None or game.notes == "")
-        ):
-            g_copy = copy.copy(game)
-            g_copy.group_metadata = "Missing PC Subplatform"
-            invalid_games.append(g_copy)
-
-        # Unowned With Ownership Metadata
-        if not game.owned and (
-            game.owned_condition is not None
-            or (game.date_purchased is not None and game.date_purchased != "")
-            or (game.purchase_price is not None and game.purchase_price != "")
-            or (game.owned_format is not None and game.owned_format != "")
-        ):
-            g_copy = copy.copy(game)
-            g_copy.group_metadata = "Unowned With Ownership Metadata"
-            invalid_games.append(g_copy)
-
-        # Browser Based Games Without Links
-        if (
-            not game.completed
-            and game.platform == ExcelPlatform.BROWSER
-            and game.notes
-            not in (
-                "Link",
-                "itch.io",
-            )
-        ):
-            g_copy = copy.copy(game)
-            g_copy.group_metadata = "Browser Games Without Links"
-            invalid_games.append(g_copy)
-
-        # Missing Translation Info
-        if (
-            game.release_region
-            not in (
-                ExcelRegion.EUROPE,
-                ExcelRegion.NORTH_AMERICA,
-                ExcelRegion.AUSTRALIA,
-            )
-            and game.translation is None
-        ):
-            g_copy = copy.copy(game)
-            g_copy.group_metadata = "Missing Translation Info"
-            invalid_games.append(g_copy)
-
-        # Estimated Time Not Multiple of 0.5
-        if (
-            game.estimated_playtime is not None
-            and game.estimated_playtime > 1
-            and game.estimated_playtime != 0.5 * round(game.estimated_playtime / 0.5)
-        ):
-            g_copy = copy.copy(game)
-            g_copy.group_metadata = "Estimated Playtime Using Incorrect Multiple"
-            invalid_games.append(g_copy)
-
-        # Trailing Whitespace
-        if (
-            game.title != game.title.strip()
-            or game.publisher != game.publisher.strip()
-            or game.developer != game.developer.strip()
-            or (game.franchise is not None and game.franchise != game.franchise.strip())
-        ):
-            g_copy = copy.copy(game)
-            g_copy.group_metadata = "Trailing Whitespace"
-            invalid_games.append(g_copy)
-
-        double_space_re = r"[ ]{2,}"
-
-        # Double Spaces
-        if (
-            re.search(double_space_re, game.title) is not None
-            or re.search(double_space_re, game.publisher) is not None
-            or re.search(double_space_re, game.developer) is not None
-            or (
-                game.franchise is not None
-                and re.search(double_space_re, game.franchise) is not None
-            )
-        ):
-            g_copy = copy.copy(game)
-            g_copy.group_metadata = "Double Spaces"
-            invalid_games.append(g_copy)
-
-        # Start Date After Completed Date
-        if (
-            game.date_started is not None
-            and game.date_completed is not None
-            and game.date_started > game.date_completed
-        ):
-            g_copy = copy.copy(game)
-            g_copy.group_metadata = "Start Date After Completed Date"
-            invalid_games.append(g_copy)
-
     games_dict = {g.hash_id: g for g in data_provider.get_games()}
+    context = ValidationContext(
+        set(g.title for g in games),
+        games_dict,
+        {g.game_order_hash_id: g for g in data_provider.get_games()},
+        datetime.datetime.now().date(),
+    )
 
-    def round_to_2(num: float) -> float:
-        return float(f"{num:,.2f}")
+    completed_games = sorted(
+        data_provider.get_completed_games(),
+        key=lambda g: g.completion_number,
+    )
+    games_on_order = data_provider.get_games_on_order()
+    _, errors = data_provider.get_merged_games()
+    collections = [
+        g for g in data_provider.get_collections() if g.hash_id in games_dict
+    ]
 
-    def to_percent(num: float) -> int:
-        return round(num * 100)
+    invalid_games: List[ExcelGame] = []
 
-    for cur, game in enumerate(
-        sorted(
-            data_provider.get_completed_games(),
-            key=lambda g: g.completion_number,
-        )
+    for source, source_games in (
+        (RuleSource.GAMES, games),
+        (RuleSource.COMPLETED, completed_games),
+        (RuleSource.GAMES_ON_ORDER, games_on_order),
     ):
-        # Collection Title Missing from Main Sheet
-        if (
-            game.collection is not None
-            and game.collection != ""
-            and game.collection not in all_titles
-        ):
-            g_copy = copy.copy(game)
-            g_copy.group_metadata = "Completed: Collection Mismatch"
-            invalid_games.append(g_copy)
-
-        # Typo in Notes
-        if game.notes is not None and game.notes != "":
-            pass
-
-        # Incorrect Completion Number
-        if game.completion_number != cur + 1:
-            g_copy = copy.copy(game)
-            g_copy.group_metadata = "Completed: Completion Number Incorrect"
-            invalid_games.append(g_copy)
-
-        if game.hash_id in games_dict:
-            # Rating Mismatch
-            if to_percent(game.rating) != to_percent(
-                games_dict[game.hash_id].rating or 0
-            ):
-                g_copy = copy.copy(game)
-                g_copy.group_metadata = "Completed: Rating Mismatch"
-                invalid_games.append(g_copy)
-
-            # Playtime Mismatch
-            if round_to_2(game.completion_time or 0) != round_to_2(
-                games_dict[game.hash_id].completion_time or 0
-            ):
-                g_copy = copy.copy(game)
-                g_copy.group_metadata = "Completed: Completion Time Mismatch"
-                invalid_games.append(g_copy)
-
-            # Completed Date Mismatch
-            if game.date_completed != games_dict[game.hash_id].date_completed:
-                g_copy = copy.copy(game)
-                g_copy.group_metadata = "Completed: Completed Date Mismatch"
-                invalid_games.append(g_copy)
-
-            # Started Date Mismatch
-            if game.date_started != games_dict[game.hash_id].date_started:
-                g_copy = copy.copy(game)
-                g_copy.group_metadata = "Completed: Completed Start Date Mismatch"
-                invalid_games.append(g_copy)
-
-            # Missing VR Metadata
-            if game.played_in_vr and not games_dict[game.hash_id].vr:
-                g_copy = copy.copy(game)
-                g_copy.group_metadata = "Completed: VR Metadata Mismatch"
-                invalid_games.append(g_copy)
-
-    order_hash_dict = {g.game_order_hash_id: g for g in data_provider.get_games()}
-
-    for game in data_provider.get_games_on_order():
-        # Estimated Release Passed
-        if (
-            game.estimated_release is not None
-            and game.estimated_release.date() < datetime.datetime.now().date()
-        ):
-            g_copy = copy.copy(game)
-            g_copy.group_metadata = "Games on Order: Past Estimated Release"
-            invalid_games.append(g_copy)
-
-        # Games Added to Main Sheet but Not Removed from Games on Order
-        if game.game_order_hash_id in order_hash_dict:
-            g_copy = copy.copy(game)
-            g_copy.group_metadata = "Games on Order: Not Removed From Order Sheet"
-            invalid_games.append(g_copy)
-
-    merged_games, errors = data_provider.get_excel_loader().merge()
-
-    for error in errors:
-        e_game, msg = error
-        g_copy = copy.copy(e_game)
-        g_copy.group_metadata = msg
-        invalid_games.append(g_copy)
-
-    for game in merged_games:
-        if any(game.child_games) and game.hash_id in games_dict:
-            # Collection's Total Playtime Doesn't Match Individual Entries
-            if round_to_2(sum(g.completion_time or 0 for g in game.child_games)) > (
-                round_to_2(games_dict[game.hash_id].completion_time or 0)
-            ):
-                g_copy = copy.copy(game)
-                g_copy.group_metadata = "Completed: Collection Completion Time Mismatch"
-                invalid_games.append(g_copy)
-
-            # Collection's Rating Doesn't Match Individual Entries' Average
-            if to_percent(
-                statistics.mean(g.rating for g in game.child_games)
-            ) != to_percent(games_dict[game.hash_id].rating or 0):
-                g_copy = copy.copy(game)
-                g_copy.group_metadata = "Completed: Collection Rating Mismatch"
-                invalid_games.append(g_copy)
-
-            # Collection's Completed Date Doesn't Match Individual Entries' Max
-            if (
-                games_dict[game.hash_id].completed
-                and any(
-                    filter(lambda g: g.date_completed is not None, game.child_games)
-                )
-                and games_dict[game.hash_id].date_completed
-                != max(
-                    g.date_completed
-                    for g in filter(
-                        lambda _g: _g.date_completed is not None, game.child_games
-                    )
-                )
-            ):
-                g_copy = copy.copy(game)
-                g_copy.group_metadata = "Completed: Collection Completed Date Mismatch"
-                invalid_games.append(g_copy)
+        invalid_games.extend(
+            materialize_violations(
+                source_games, evaluate_rules(source, source_games, context)
+            )
+        )
+
+    invalid_games.extend(e_game.get_copy_with_metadata(msg) for e_game, msg in errors)
+
+    invalid_games.extend(
+        materialize_violations(
+            collections, evaluate_rules(RuleSource.COLLECTIONS, collections, context)
+        )
+    )
 
     return invalid_games
 
@@ -0,0 +1,190 @@
+import hashlib
+import os
+import sqlite3
+
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+
+class ManifestEntry(NamedTuple):
+    path: str
+    directory: str
+    name: str
+    is_dir: bool
+    size: Optional[int]
+    mtime: Optional[int]
+    hash: Optional[str] = None
+
+
+class LibraryManifest:
+    __DATABASE_FILE_NAME = "library.db"
+    __HASH_CHUNK_SIZE = 1 << 16
+
+    _connection: sqlite3.Connection
+
+    def __init__(self, file_name: str = __DATABASE_FILE_NAME):
+        self._connection = sqlite3.connect(file_name)
+        self._connection.executescript("""
+            CREATE TABLE IF NOT EXISTS directories (
+                path TEXT PRIMARY KEY,
+                mtime INTEGER
+            );
+            CREATE TABLE IF NOT EXISTS entries (
+                path TEXT PRIMARY KEY,
+                directory TEXT NOT NULL,
+                name TEXT NOT NULL,
+                is_dir INTEGER NOT NULL,
+                size INTEGER,
+                mtime INTEGER,
+                hash TEXT
+            );
+            CREATE INDEX IF NOT EXISTS entries_directory ON entries (directory);
+            CREATE INDEX IF NOT EXISTS entries_name ON entries (name);
+            """)
+
+    @staticmethod
+    def get_fast_hash(path: str, size: int) -> str:
+        digest = hashlib.blake2b(size.to_bytes(8, "little"), digest_size=16)
+
+        with open(path, "rb") as f:
+            digest.update(f.read(LibraryManifest.__HASH_CHUNK_SIZE))
+
+            if size > LibraryManifest.__HASH_CHUNK_SIZE * 2:
+                f.seek(-LibraryManifest.__HASH_CHUNK_SIZE, os.SEEK_END)
+                digest.update(f.read())
+
+        return digest.hexdigest()
+
+    def close(self):
+        self._connection.close()
+
+    def get_directory_mtimes(self) -> Dict[str, Optional[int]]:
+        return dict(self._connection.execute("SELECT path, mtime FROM directories"))
+
+    def get_subdirectories(self) -> Dict[str, List[str]]:
+        subdirectories: Dict[str, List[str]] = {}
+
+        for directory, path in self._connection.execute(
+            "SELECT directory, path FROM entries WHERE is_dir = 1"
+        ):
+            subdirectories.setdefault(directory, []).append(path)
+
+        return subdirectories
+
+    def get_files(self) -> Dict[str, List[ManifestEntry]]:
+        files: Dict[str, List[ManifestEntry]] = {}
+
+        for path, directory, name, size, mtime, file_hash in self._connection.execute(
+            "SELECT path, directory, name, size, mtime, hash FROM entries "
+            "WHERE is_dir = 0"
+        ):
+            files.setdefault(directory, []).append(
+                ManifestEntry(path, directory, name, False, size, mtime, file_hash)
+            )
+
+        return files
+
+    def get_entries(self, directories: Iterable[str]) -> List[ManifestEntry]:
+        entries = []
+
+        for directory in directories:
+            entries.extend(
+                ManifestEntry(
+                    path, directory, name, bool(is_dir), size, mtime, file_hash
+                )
+                for path, name, is_dir, size, mtime, file_hash in self._connection.execute(
+                    "SELECT path, name, is_dir, size, mtime, hash FROM entries "
+                    "WHERE directory = ?",
+                    (directory,),
+                )
+            )
+
+        return entries
+
+    def find(self, name: str) -> List[ManifestEntry]:
+        return [
+            ManifestEntry(path, directory, name, bool(is_dir), size, mtime, file_hash)
+            for path, directory, is_dir, size, mtime, file_hash in self._connection.execute(
+                "SELECT path, directory, is_dir, size, mtime, hash FROM entries "
+                "WHERE name = ?",
+                (name,),
+            )
+        ]
+
+    @staticmethod
+    def __get_tree_pattern(directory: str) -> str:
+        escaped = directory.replace("!", "!!").replace("%", "!%").replace("_", "!_")
+        return f"{escaped}{os.sep}%"
+
+    def get_total_size(self, directory: str) -> int:
+        (size,) = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries "
+            "WHERE directory = ? OR directory LIKE ? ESCAPE '!'",
+            (directory, self.__get_tree_pattern(directory)),
+        ).fetchone()
+
+        return size
+
+    def update_directory(
+        self,
+        directory: str,
+        mtime: Optional[int],
+        entries: List[ManifestEntry],
+    ):
+        previous = {e.path: e for e in self.get_entries([directory])}
+        current = set(e.path for e in entries)
+
+        for removed in previous.values():
+            if removed.is_dir and removed.path not in current:
+                self.__remove_tree(removed.path)
+
+        entries = [
+            (
+                e._replace(hash=previous[e.path].hash)
+                if e.hash is None
+                and e.path in previous
+                and (previous[e.path].size, previous[e.path].mtime) == (e.size, e.mtime)
+                else e
+            )
+            for e in entries
+        ]
+
+        self._connection.execute(
+            "DELETE FROM entries WHERE directory = ?", (directory,)
+        )
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO entries "
+            "(path, directory, name, is_dir, size, mtime, hash) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            entries,
+        )
+        self._connection.execute(
+            "INSERT OR REPLACE INTO directories (path, mtime) VALUES (?, ?)",
+            (directory, mtime),
+        )
+
+    def update_files(self, entries: Iterable[ManifestEntry]):
+        self._connection.executemany(
+            "UPDATE entries SET size = ?, mtime = ?, hash = NULL WHERE path = ?",
+            ((e.size, e.mtime, e.path) for e in entries),
+        )
+
+    def set_hashes(self, hashes: Iterable[Tuple[str, Optional[str]]]):
+        self._connection.executemany(
+            "UPDATE entries SET hash = ? WHERE path = ?",
+            ((file_hash, path) for path, file_hash in hashes),
+        )
+
+    def __remove_tree(self, directory: str):
+        pattern = self.__get_tree_pattern(directory)
+
+        self._connection.execute(
+            "DELETE FROM entries WHERE directory = ? OR directory LIKE ? ESCAPE '!'",
+            (directory, pattern),
+        )
+        self._connection.execute(
+            "DELETE FROM directories WHERE path = ? OR path LIKE ? ESCAPE '!'",
+            (directory, pattern),
+        )
+
+    def commit(self):
+        self._connection.commit()
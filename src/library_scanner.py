@@ -0,0 +1,298 @@
+import json
+import os
+
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from excel_game import ExcelPlatform
+from match_validator import MatchValidator
+
+from library_manifest import LibraryManifest, ManifestEntry
+
+LIBRARY_FOLDERS_FILE = "library_folders.json"
+
+LibraryFolder = Tuple[str, bool]
+FolderScan = Tuple[
+    List[str],
+    Dict[str, Tuple[Optional[int], List[ManifestEntry]]],
+    List[ManifestEntry],
+]
+
+
+class LibraryScanPlan:
+    _skipped: Set[ExcelPlatform]
+    _aliases: Dict[str, ExcelPlatform]
+    _folders: Dict[ExcelPlatform, List[LibraryFolder]]
+
+    def __init__(self, file_name: str = LIBRARY_FOLDERS_FILE):
+        with open(file_name, "r", encoding="utf-8") as f:
+            config = json.load(f)
+
+        self._skipped = set(ExcelPlatform[name] for name in config["skip"])
+        self._aliases = {
+            substring: ExcelPlatform[name]
+            for substring, name in config["aliases"].items()
+        }
+        self._folders = {
+            ExcelPlatform[name]: [
+                (folder, entry.get("recursive", False)) for folder in entry["folders"]
+            ]
+            for name, entry in config["platforms"].items()
+        }
+
+    def is_skipped(self, platform: Optional[ExcelPlatform]) -> bool:
+        return platform in self._skipped
+
+    def get_folders(self, platform: Optional[ExcelPlatform]) -> List[LibraryFolder]:
+        if platform in self._folders:
+            return self._folders[platform]
+
+        if isinstance(platform, str):
+            for substring, alias in self._aliases.items():
+                if substring in platform:
+                    return self._folders.get(alias, [])
+
+        return []
+
+
+class LibraryScanner:
+    __IGNORED_FILES = frozenset(["desktop.ini"])
+
+    _manifest: LibraryManifest
+    _max_workers: Optional[int]
+    _hash_files: bool
+    _refresh_files: bool
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        hash_files: bool = False,
+        manifest: Optional[LibraryManifest] = None,
+        refresh_files: bool = False,
+    ):
+        self._manifest = manifest or LibraryManifest()
+        self._max_workers = max_workers
+        self._hash_files = hash_files
+        self._refresh_files = refresh_files
+
+    @staticmethod
+    def __get_mtime(folder: str) -> Optional[int]:
+        try:
+            return os.stat(folder).st_mtime_ns
+        except OSError:
+            return None
+
+    def __list_directory(self, directory: str) -> List[ManifestEntry]:
+        entries = []
+
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    is_dir = entry.is_dir()
+
+                    if not is_dir and entry.name in self.__IGNORED_FILES:
+                        continue
+
+                    stat = entry.stat()
+                    entries.append(
+                        ManifestEntry(
+                            entry.path,
+                            directory,
+                            entry.name,
+                            is_dir,
+                            None if is_dir else stat.st_size,
+                            stat.st_mtime_ns,
+                        )
+                    )
+        except OSError:
+            pass
+
+        return entries
+
+    @staticmethod
+    def __get_changed_files(
+        files: List[ManifestEntry],
+    ) -> Optional[List[ManifestEntry]]:
+        changed = []
+
+        for entry in files:
+            try:
+                stat = os.stat(entry.path)
+            except OSError:
+                return None
+
+            if (stat.st_size, stat.st_mtime_ns) != (entry.size, entry.mtime):
+                changed.append(
+                    entry._replace(size=stat.st_size, mtime=stat.st_mtime_ns, hash=None)
+                )
+
+        return changed
+
+    def __walk(
+        self,
+        folder: LibraryFolder,
+        mtimes: Dict[str, Optional[int]],
+        subdirectories: Dict[str, List[str]],
+        files: Dict[str, List[ManifestEntry]],
+    ) -> FolderScan:
+        root, recursive = folder
+        visited: List[str] = []
+        listed: Dict[str, Tuple[Optional[int], List[ManifestEntry]]] = {}
+        changed: List[ManifestEntry] = []
+        pending: List[str] = [root]
+
+        while pending:
+            current = pending.pop()
+            visited.append(current)
+            mtime = self.__get_mtime(current)
+            changed_files: Optional[List[ManifestEntry]] = None
+
+            # Files rewritten in place don't touch their directory's mtime, so
+            # they're only checked when hashing or explicitly refreshing.
+            if current in mtimes and mtimes[current] == mtime:
+                changed_files = (
+                    self.__get_changed_files(files.get(current, []))
+                    if self._hash_files or self._refresh_files
+                    else []
+                )
+
+            if changed_files is not None:
+                changed.extend(changed_files)
+                children = subdirectories.get(current, [])
+            else:
+                entries = self.__list_directory(current) if mtime is not None else []
+                listed[current] = (mtime, entries)
+                children = [e.path for e in entries if e.is_dir]
+
+            if recursive:
+                pending.extend(children)
+
+        return (visited, listed, changed)
+
+    def __hash_entries(self, directories: List[str], executor: ThreadPoolExecutor):
+        unhashed = [
+            e
+            for e in self._manifest.get_entries(directories)
+            if not e.is_dir and e.hash is None
+        ]
+
+        def get_hash(entry: ManifestEntry) -> Tuple[str, Optional[str]]:
+            try:
+                return (
+                    entry.path,
+                    LibraryManifest.get_fast_hash(entry.path, entry.size),
+                )
+            except OSError:
+                return (entry.path, None)
+
+        self._manifest.set_hashes(executor.map(get_hash, unhashed))
+
+    def scan(self, folders: Iterable[LibraryFolder]) -> Dict[LibraryFolder, Set[str]]:
+        unique_folders = list(dict.fromkeys(folders))
+        mtimes = self._manifest.get_directory_mtimes()
+        subdirectories = self._manifest.get_subdirectories()
+        files = (
+            self._manifest.get_files()
+            if self._hash_files or self._refresh_files
+            else {}
+        )
+
+        with ThreadPoolExecutor(self._max_workers) as executor:
+            results = list(
+                executor.map(
+                    lambda f: self.__walk(f, mtimes, subdirectories, files),
+                    unique_folders,
+                )
+            )
+
+            updated = set()
+
+            for _, listed, changed in results:
+                self._manifest.update_files(changed)
+
+                for directory, (mtime, entries) in listed.items():
+                    if directory not in updated:
+                        self._manifest.update_directory(directory, mtime, entries)
+                        updated.add(directory)
+
+            if self._hash_files:
+                self.__hash_entries(
+                    list(
+                        dict.fromkeys(d for visited, _, _ in results for d in visited)
+                    ),
+                    executor,
+                )
+
+        self._manifest.commit()
+
+        return {
+            folder: set(
+                e.name if e.is_dir else Path(e.name).stem
+                for e in self._manifest.get_entries(visited)
+            )
+            for folder, (visited, _, _) in zip(unique_folders, results)
+        }
+
+
+class LibraryIndex:
+    __IGNORED_TOKENS = frozenset(["a", "an", "the"])
+
+    _names: Set[str]
+    _normalized_names: Set[str]
+    _blocks: Dict[str, List[str]]
+    _validator: MatchValidator
+    _normalized: Dict[str, str]
+
+    def __init__(
+        self,
+        names: Iterable[str],
+        validator: MatchValidator,
+        normalized: Optional[Dict[str, str]] = None,
+    ):
+        self._names = set(names)
+        self._validator = validator
+        self._normalized = normalized if normalized is not None else {}
+        self._normalized_names = set()
+        self._blocks = defaultdict(list)
+
+        for name in self._names:
+            normalized_name = self.__normalize(name)
+            self._normalized_names.add(normalized_name)
+            self._blocks[self.__get_block_key(normalized_name)].append(name)
+
+    def __normalize(self, title: str) -> str:
+        normalized = self._normalized.get(title)
+
+        if normalized is None:
+            normalized = self._validator.normalize(title)
+            self._normalized[title] = normalized
+
+        return normalized
+
+    def __get_block_key(self, normalized_title: str) -> str:
+        tokens = normalized_title.split()
+
+        for token in tokens:
+            if token not in self.__IGNORED_TOKENS:
+                return token
+
+        return tokens[0] if any(tokens) else ""
+
+    def contains(self, title: str, mame_romset: Optional[str] = None) -> bool:
+        if mame_romset is not None and mame_romset in self._names:
+            return True
+
+        if title in self._names:
+            return True
+
+        normalized_title = self.__normalize(title)
+
+        if normalized_title in self._normalized_names:
+            return True
+
+        return any(
+            self._validator.titles_equal_fuzzy(name, title)
+            for name in self._blocks.get(self.__get_block_key(normalized_title), [])
+        )
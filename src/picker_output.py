@@ -30,27 +30,7 @@ def get_group_output(
     output += f"{spacer * level}{markdown_heading}{group_name}:\n\n"
 
     if len(selector.grouping.subgroupings) == level:
-        games: List[PickedGame] = sorted(
-            group, key=selector.sort, reverse=selector.reverse_sort
-        )[: grouping.group_size]
-
-        if grouping.group_size is not None and grouping.should_rank:
-            # May need to elect a new highest priority game
-            highest: Optional[PickedGame] = None
-
-            for g in games:
-                if highest is None:
-                    highest = g
-                elif g.highest_priority:
-                    highest = g
-                    break
-                elif g.game.combined_rating > highest.game.combined_rating or (
-                    g.game.combined_rating == highest.game.combined_rating
-                    and g.game.normal_title > highest.game.normal_title
-                ):
-                    highest = g
-
-            highest.highest_priority = True
+        games: List[PickedGame] = grouping.ranked(group)
 
         def get_game_string(index: int, g: PickedGame) -> str:
             with_year = (
@@ -0,0 +1,172 @@
+import copy
+import pickle
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from excel_game import ExcelGame
+
+from data_provider import DataProvider
+from excel_backed_cache import ExcelBackedCache
+from picker_enums import PickerMode
+from selection_store import SelectionStore
+
+SelectionReference = Tuple[str, str, int]
+
+
+class CachedSelection(NamedTuple):
+    reference: Optional[SelectionReference]
+    is_copy: bool
+    value: Any
+
+
+class SelectionCache:
+    __FORMAT_VERSION = 2
+    __METADATA_FIELD = "group_metadata"
+
+    _cache: ExcelBackedCache
+    _store: Optional[SelectionStore]
+    _data_provider: Optional[DataProvider]
+    _references: Optional[Dict[int, SelectionReference]]
+    _games: Optional[Dict[SelectionReference, ExcelGame]]
+    _by_hash_id: Optional[Dict[str, List[SelectionReference]]]
+
+    def __init__(self, data_provider: Optional[DataProvider] = None):
+        self._cache = ExcelBackedCache()
+        self._store = None
+        self._data_provider = data_provider
+        self._references = None
+        self._games = None
+        self._by_hash_id = None
+
+    def __build_index(self):
+        self._references = {}
+        self._games = {}
+        self._by_hash_id = {}
+
+        if self._data_provider is None:
+            return
+
+        for source, games in (
+            ("games", self._data_provider.get_games()),
+            ("played", self._data_provider.get_played_games()),
+            ("unplayed", self._data_provider.get_unplayed_candidates()),
+            ("completed", self._data_provider.get_completed_games()),
+            ("on_order", self._data_provider.get_games_on_order()),
+        ):
+            occurrences: Dict[str, int] = {}
+
+            for game in games:
+                ordinal = occurrences.get(game.hash_id, 0)
+                occurrences[game.hash_id] = ordinal + 1
+                reference = (source, game.hash_id, ordinal)
+
+                self._references.setdefault(id(game), reference)
+                self._games[reference] = game
+                self._by_hash_id.setdefault(game.hash_id, []).append(reference)
+
+    def __get_fields(self, game: ExcelGame) -> Dict[str, Any]:
+        return {k: v for k, v in vars(game).items() if k != self.__METADATA_FIELD}
+
+    def __get_copied_reference(self, game: ExcelGame) -> Optional[SelectionReference]:
+        fields = self.__get_fields(game)
+
+        for reference in self._by_hash_id.get(game.hash_id, []):
+            if self.__get_fields(self._games[reference]) == fields:
+                return reference
+
+        return None
+
+    def __to_row(self, game: ExcelGame) -> CachedSelection:
+        reference = self._references.get(id(game))
+        metadata = getattr(game, self.__METADATA_FIELD, None)
+
+        if reference is not None and self._games[reference] is game:
+            if metadata is not None:
+                return CachedSelection(reference, True, metadata)
+
+            return CachedSelection(reference, False, None)
+
+        reference = self.__get_copied_reference(game)
+
+        if reference is not None:
+            return CachedSelection(reference, True, metadata)
+
+        return CachedSelection(None, False, game)
+
+    def __from_row(self, row: CachedSelection) -> Optional[ExcelGame]:
+        if row.reference is None:
+            return row.value
+
+        game = self._games.get(row.reference)
+
+        if game is None or not row.is_copy:
+            return game
+
+        g_copy = copy.copy(game)
+        g_copy.group_metadata = row.value
+        return g_copy
+
+    def __get_store(self) -> SelectionStore:
+        if self._store is None:
+            self._store = SelectionStore()
+
+        return self._store
+
+    def __get_fingerprint(self, code_fingerprint: str) -> str:
+        return f"{self._cache.get_excel_modify_time()}:{code_fingerprint}"
+
+    def load(
+        self, selector: str, mode: PickerMode, code_fingerprint: str
+    ) -> Optional[List[ExcelGame]]:
+        data = self.__get_store().get(
+            selector, mode.name.lower(), self.__get_fingerprint(code_fingerprint)
+        )
+
+        if data is None:
+            return None
+
+        version, rows = pickle.loads(data)
+
+        if version != self.__FORMAT_VERSION:
+            return None
+
+        if self._games is None:
+            self.__build_index()
+
+        selection = []
+
+        for row in rows:
+            game = self.__from_row(row)
+
+            if game is None:
+                return None
+
+            selection.append(game)
+
+        return selection
+
+    def write(
+        self,
+        selector: str,
+        mode: PickerMode,
+        code_fingerprint: str,
+        selection: List[ExcelGame],
+    ):
+        if self._games is None:
+            self.__build_index()
+
+        self.__get_store().put(
+            selector,
+            mode.name.lower(),
+            self.__get_fingerprint(code_fingerprint),
+            pickle.dumps(
+                (self.__FORMAT_VERSION, [self.__to_row(g) for g in selection]),
+                pickle.HIGHEST_PROTOCOL,
+            ),
+        )
+
+    def flush(self):
+        if self._store is not None:
+            self._store.flush()
+
+    def remove_stale(self, mode: PickerMode, selectors: Iterable[str]) -> List[str]:
+        return self.__get_store().remove_stale(mode.name.lower(), selectors)
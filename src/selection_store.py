@@ -0,0 +1,129 @@
+import os
+import sqlite3
+import time
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+SelectionKey = Tuple[str, str, str]
+
+
+class SelectionStore:
+    __DATABASE_FILE_NAME = os.path.join("caches", "selections.db")
+    __MAX_SIZE = 256 * 1024 * 1024
+    __MMAP_SIZE = 256 * 1024 * 1024
+
+    _connection: sqlite3.Connection
+    _max_size: int
+    _last_used: Dict[SelectionKey, float]
+
+    def __init__(
+        self, file_name: str = __DATABASE_FILE_NAME, max_size: int = __MAX_SIZE
+    ):
+        folder = os.path.dirname(file_name)
+
+        if folder and not os.path.exists(folder):
+            os.mkdir(folder)
+
+        self._max_size = max_size
+        self._last_used = {}
+        self._connection = sqlite3.connect(file_name)
+        self._connection.executescript(f"""
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            PRAGMA mmap_size = {self.__MMAP_SIZE};
+            CREATE TABLE IF NOT EXISTS selections (
+                selector TEXT NOT NULL,
+                mode TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                data BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (selector, mode, fingerprint)
+            );
+            CREATE INDEX IF NOT EXISTS selections_last_used ON selections (last_used);
+            """)
+
+    def flush(self):
+        if not any(self._last_used):
+            return
+
+        with self._connection:
+            self._connection.executemany(
+                "UPDATE selections SET last_used = ? "
+                "WHERE selector = ? AND mode = ? AND fingerprint = ?",
+                (
+                    (last_used, selector, mode, fingerprint)
+                    for (selector, mode, fingerprint), last_used in (
+                        self._last_used.items()
+                    )
+                ),
+            )
+
+        self._last_used = {}
+
+    def close(self):
+        self.flush()
+        self._connection.close()
+
+    def get(self, selector: str, mode: str, fingerprint: str) -> Optional[bytes]:
+        row = self._connection.execute(
+            "SELECT data FROM selections "
+            "WHERE selector = ? AND mode = ? AND fingerprint = ?",
+            (selector, mode, fingerprint),
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        self._last_used[(selector, mode, fingerprint)] = time.time()
+        return row[0]
+
+    def put(self, selector: str, mode: str, fingerprint: str, data: bytes):
+        self._last_used.pop((selector, mode, fingerprint), None)
+        self.flush()
+
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO selections "
+                "(selector, mode, fingerprint, data, size, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (selector, mode, fingerprint, data, len(data), time.time()),
+            )
+            self.__evict()
+
+    def __evict(self):
+        total_size = 0
+        evicted: List[Tuple[str, str, str]] = []
+
+        for selector, mode, fingerprint, size in self._connection.execute(
+            "SELECT selector, mode, fingerprint, size FROM selections "
+            "ORDER BY last_used DESC"
+        ):
+            total_size += size
+
+            if total_size > self._max_size:
+                evicted.append((selector, mode, fingerprint))
+
+        self._connection.executemany(
+            "DELETE FROM selections "
+            "WHERE selector = ? AND mode = ? AND fingerprint = ?",
+            evicted,
+        )
+
+    def remove_stale(self, mode: str, selectors: Iterable[str]) -> List[str]:
+        expected = set(selectors)
+        stale = [
+            selector
+            for (selector,) in self._connection.execute(
+                "SELECT DISTINCT selector FROM selections WHERE mode = ?", (mode,)
+            )
+            if selector not in expected
+        ]
+
+        with self._connection:
+            self._connection.executemany(
+                "DELETE FROM selections WHERE selector = ? AND mode = ?",
+                ((selector, mode) for selector in stale),
+            )
+
+        return stale
@@ -247,171 +247,6 @@ class SelectorLibrary:
                 ],
                 gs.Selector.OFFBEAT_GENRE_GAMES.value,
             ),
-            gs.Selector.ONE_PER_ADDED_DATE_CHALLENGE: gs.get_one_per_criteria_challenge_selector(
-                "Added Date",
-                self._data_provider,
-                lambda g: (
-                    g.date_added.strftime("%B, %Y")
-                    if g.date_added is not None
-                    else "No Added Date"
-                ),
-                games_override=list(
-                    filter(
-                        lambda g: g.date_added is not None,
-                        self._data_provider.get_unplayed_candidates(),
-                    )
-                ),
-                custom_grouping_sort=lambda kvp: kvp[1][-1].game.date_added
-                or datetime.datetime.max,
-                custom_grouping_sort_reverse=True,
-            ),
-            gs.Selector.ONE_PER_ADDED_DATE_CHALLENGE_COMPLETIONS: gs.get_one_per_criteria_challenge_selector(
-                "Added Date",
-                self._data_provider,
-                lambda g: (
-                    g.date_added.strftime("%B, %Y")
-                    if g.date_added is not None
-                    else "No Added Date"
-                ),
-                games_override=list(
-                    filter(
-                        lambda g: g.date_added is not None,
-                        self._data_provider.get_played_games(),
-                    )
-                ),
-                custom_grouping_sort=lambda kvp: kvp[1][-1].game.date_added
-                or datetime.datetime.max,
-                custom_grouping_sort_reverse=True,
-                completions=True,
-            ),
-            gs.Selector.ONE_PER_ALPHABET_CHALLENGE: gs.get_one_per_criteria_challenge_selector(
-                "Letter", self._data_provider, gs.get_alphabetical_first_letter
-            ),
-            gs.Selector.ONE_PER_ALPHABET_CHALLENGE_COMPLETIONS: gs.get_one_per_criteria_challenge_selector(
-                "Letter",
-                self._data_provider,
-                gs.get_alphabetical_first_letter,
-                games_override=self._data_provider.get_played_games(),
-                completions=True,
-            ),
-            gs.Selector.ONE_PER_FAN_TRANSLATION_CHALLENGE: gs.get_one_per_criteria_challenge_selector(
-                "Fan Translation",
-                self._data_provider,
-                lambda g: gs.get_platform_completion_id(g)
-                + f" ({'Translated' if g.translation == TranslationStatus.COMPLETE else 'Untranslated'})",
-                games_override=list(
-                    filter(
-                        lambda g: g.translation == TranslationStatus.COMPLETE
-                        and not g.owned,
-                        self._data_provider.get_unplayed_candidates(),
-                    )
-                ),
-            ),
-            gs.Selector.ONE_PER_FAN_TRANSLATION_CHALLENGE_COMPLETIONS: gs.get_one_per_criteria_challenge_selector(
-                "Fan Translation",
-                self._data_provider,
-                lambda g: gs.get_platform_completion_id(g)
-                + f" ({'Translated' if g.translation == TranslationStatus.COMPLETE else 'Untranslated'})",
-                games_override=list(
-                    filter(
-                        lambda g: g.translation == TranslationStatus.COMPLETE
-                        and not g.owned,
-                        self._data_provider.get_played_games(),
-                    )
-                ),
-                completions=True,
-            ),
-            gs.Selector.ONE_PER_FRANCHISE_CONTENDER_CHALLENGE: gs.get_one_per_criteria_challenge_selector(
-                "Franchise Contender",
-                self._data_provider,
-                lambda g: g.franchise,
-                games_override=list(
-                    filter(
-                        lambda g: g.franchise in gs.FRANCHISE_CONTENDERS,
-                        self._data_provider.get_unplayed_candidates(),
-                    )
-                ),
-            ),
-            gs.Selector.ONE_PER_FRANCHISE_CONTENDER_CHALLENGE_COMPLETIONS: gs.get_one_per_criteria_challenge_selector(
-                "Franchise Contender",
-                self._data_provider,
-                lambda g: g.franchise,
-                games_override=list(
-                    filter(
-                        lambda g: g.franchise in gs.FRANCHISE_CONTENDERS,
-                        self._data_provider.get_played_games(),
-                    )
-                ),
-                completions=True,
-            ),
-            gs.Selector.ONE_PER_GENRE_CHALLENGE: gs.get_one_per_criteria_challenge_selector(
-                "Genre", self._data_provider, lambda g: g.genre
-            ),
-            gs.Selector.ONE_PER_GENRE_CHALLENGE_COMPLETIONS: gs.get_one_per_criteria_challenge_selector(
-                "Genre",
-                self._data_provider,
-                lambda g: g.genre,
-                games_override=self._data_provider.get_played_games(),
-                completions=True,
-            ),
-            gs.Selector.ONE_PER_LIMITED_PRINT_CHALLENGE: gs.get_one_per_criteria_challenge_selector(
-                "Limited Print",
-                self._data_provider,
-                lambda g: g.limited_print_company,
-                games_override=list(
-                    filter(
-                        lambda g: g.limited_print_company is not None,
-                        self._data_provider.get_unplayed_candidates(),
-                    )
-                ),
-            ),
-            gs.Selector.ONE_PER_LIMITED_PRINT_CHALLENGE_COMPLETIONS: gs.get_one_per_criteria_challenge_selector(
-                "Limited Print",
-                self._data_provider,
-                lambda g: g.limited_print_company,
-                games_override=list(
-                    filter(
-                        lambda g: g.limited_print_company is not None,
-                        self._data_provider.get_played_games(),
-                    )
-                ),
-                completions=True,
-            ),
-            # Completed 2 times
-            gs.Selector.ONE_PER_PERCENTILE_CHALLENGE: gs.get_one_per_criteria_challenge_selector(
-                "Percentile",
-                self._data_provider,
-                lambda g: gs.group_by_percentile(g, self._data_provider),
-                challenge_start=datetime.datetime(2025, 2, 5),
-                custom_grouping_sort=lambda kvp: self._data_provider.get_percentile_ranking_for_game(
-                    kvp[1][-1].game
-                ).value,
-                custom_grouping_sort_reverse=True,
-            ),
-            gs.Selector.ONE_PER_PERCENTILE_CHALLENGE_COMPLETIONS: gs.get_one_per_criteria_challenge_selector(
-                "Percentile",
-                self._data_provider,
-                lambda g: gs.group_by_percentile(g, self._data_provider),
-                games_override=self._data_provider.get_played_games(),
-                completions=True,
-                challenge_start=datetime.datetime(2025, 2, 5),
-                custom_grouping_sort=lambda kvp: self._data_provider.get_percentile_ranking_for_game(
-                    kvp[1][-1].game
-                ).value,
-                custom_grouping_sort_reverse=True,
-            ),
-            gs.Selector.ONE_PER_PLATFORM_CHALLENGE: gs.get_one_per_criteria_challenge_selector(
-                "Platform",
-                self._data_provider,
-                gs.get_platform_completion_id,
-            ),
-            gs.Selector.ONE_PER_PLATFORM_CHALLENGE_COMPLETIONS: gs.get_one_per_criteria_challenge_selector(
-                "Platform",
-                self._data_provider,
-                gs.get_platform_completion_id,
-                games_override=self._data_provider.get_played_games(),
-                completions=True,
-            ),
             gs.Selector.ONE_PER_PLATFORM_CHALLENGE_UNPLAYABLE: gs.get_one_per_criteria_challenge_selector(
                 "Platform",
                 self._data_provider,
@@ -425,169 +260,6 @@ class SelectorLibrary:
                 ),
                 challenge_suffix="Unplayable",
             ),
-            gs.Selector.ONE_PER_PLAYTIME_CHALLENGE: gs.get_one_per_criteria_challenge_selector(
-                "Playtime",
-                self._data_provider,
-                gs.get_playtime,
-                custom_grouping_sort=lambda kvp: (
-                    kvp[1][-1].game.estimated_playtime or 0
-                )
-                // 1,
-            ),
-            gs.Selector.ONE_PER_PLAYTIME_CHALLENGE_COMPLETIONS: gs.get_one_per_criteria_challenge_selector(
-                "Playtime",
-                self._data_provider,
-                gs.get_playtime,
-                games_override=self._data_provider.get_played_games(),
-                completions=True,
-                custom_grouping_sort=lambda kvp: (kvp[1][-1].game.completion_time or 0)
-                // 1,
-            ),
-            gs.Selector.ONE_PER_PURCHASE_DATE_CHALLENGE: gs.get_one_per_criteria_challenge_selector(
-                "Purchase Date",
-                self._data_provider,
-                lambda g: (
-                    g.date_purchased.strftime("%B, %Y")
-                    if g.date_purchased is not None
-                    else "Not Purchased"
-                ),
-                games_override=list(
-                    filter(
-                        lambda g: g.date_purchased is not None,
-                        self._data_provider.get_unplayed_candidates(),
-                    )
-                ),
-                custom_grouping_sort=lambda kvp: kvp[1][-1].game.date_purchased
-                or datetime.datetime.max,
-                custom_grouping_sort_reverse=True,
-            ),
-            gs.Selector.ONE_PER_PURCHASE_DATE_CHALLENGE_COMPLETIONS: gs.get_one_per_criteria_challenge_selector(
-                "Purchase Date",
-                self._data_provider,
-                lambda g: (
-                    g.date_purchased.strftime("%B, %Y")
-                    if g.date_purchased is not None
-                    else "Not Purchased"
-                ),
-                games_override=list(
-                    filter(
-                        lambda g: g.date_purchased is not None,
-                        self._data_provider.get_played_games(),
-                    )
-                ),
-                custom_grouping_sort=lambda kvp: kvp[1][-1].game.date_purchased
-                or datetime.datetime.max,
-                custom_grouping_sort_reverse=True,
-                completions=True,
-            ),
-            gs.Selector.ONE_PER_PURCHASE_PRICE_CHALLENGE: gs.get_one_per_criteria_challenge_selector(
-                "Purchase Price",
-                self._data_provider,
-                lambda g: (
-                    f"${int(g.purchase_price)}.00"
-                    if int(g.purchase_price or 0) > 0
-                    else "Free"
-                ),
-                games_override=list(
-                    filter(
-                        lambda g: g.purchase_price is not None and g.purchase_price > 0,
-                        self._data_provider.get_unplayed_candidates(),
-                    )
-                ),
-                custom_grouping_sort=lambda kvp: int(kvp[1][0].game.purchase_price),
-            ),
-            gs.Selector.ONE_PER_PURCHASE_PRICE_CHALLENGE_COMPLETIONS: gs.get_one_per_criteria_challenge_selector(
-                "Purchase Price",
-                self._data_provider,
-                lambda g: (
-                    f"${int(g.purchase_price)}.00"
-                    if int(g.purchase_price or 0) > 0
-                    else "Free"
-                ),
-                games_override=list(
-                    filter(
-                        lambda g: g.purchase_price is not None
-                        and int(g.purchase_price) > 0,
-                        self._data_provider.get_played_games(),
-                    )
-                ),
-                custom_grouping_sort=lambda kvp: int(kvp[1][0].game.purchase_price),
-                completions=True,
-            ),
-            # Completed 1 time
-            gs.Selector.ONE_PER_RATING_CHALLENGE: gs.get_one_per_criteria_challenge_selector(
-                "Rating",
-                self._data_provider,
-                lambda g: f"{math.floor(g.combined_rating * 10) * 10}%",
-                challenge_start=datetime.datetime(2025, 2, 8),
-            ),
-            gs.Selector.ONE_PER_RATING_CHALLENGE_COMPLETIONS: gs.get_one_per_criteria_challenge_selector(
-                "Rating",
-                self._data_provider,
-                lambda g: f"{math.floor(g.combined_rating * 10) * 10}%",
-                games_override=self._data_provider.get_played_games(),
-                completions=True,
-                challenge_start=datetime.datetime(2025, 2, 8),
-            ),
-            gs.Selector.ONE_PER_REGION_CHALLENGE: gs.get_one_per_criteria_challenge_selector(
-                "Region",
-                self._data_provider,
-                lambda g: g.release_region.name.replace("_", " ").title(),
-            ),
-            gs.Selector.ONE_PER_REGION_CHALLENGE_COMPLETIONS: gs.get_one_per_criteria_challenge_selector(
-                "Region",
-                self._data_provider,
-                lambda g: g.release_region.name.replace("_", " ").title(),
-                games_override=self._data_provider.get_played_games(),
-                completions=True,
-            ),
-            gs.Selector.ONE_PER_TITLE_LENGTH_CHALLENGE: gs.get_one_per_criteria_challenge_selector(
-                "Title Length",
-                self._data_provider,
-                lambda g: len(g.title.replace(" ", "")),
-                custom_grouping_sort=lambda kvp: int(kvp[0]),
-            ),
-            gs.Selector.ONE_PER_TITLE_LENGTH_CHALLENGE_COMPLETIONS: gs.get_one_per_criteria_challenge_selector(
-                "Title Length",
-                self._data_provider,
-                lambda g: len(g.title.replace(" ", "")),
-                games_override=self._data_provider.get_played_games(),
-                completions=True,
-                custom_grouping_sort=lambda kvp: int(kvp[0]),
-            ),
-            gs.Selector.ONE_PER_TOP_DEVELOPER_CHALLENGE: gs.get_one_per_criteria_challenge_selector(
-                "Top Developer",
-                self._data_provider,
-                lambda g: g.developer,
-                games_override=list(
-                    filter(
-                        lambda g: g.developer in top_developers,
-                        self._data_provider.get_unplayed_candidates(),
-                    )
-                ),
-            ),
-            gs.Selector.ONE_PER_TOP_DEVELOPER_CHALLENGE_COMPLETIONS: gs.get_one_per_criteria_challenge_selector(
-                "Top Developer",
-                self._data_provider,
-                lambda g: g.developer,
-                games_override=list(
-                    filter(
-                        lambda g: g.developer in top_developers,
-                        self._data_provider.get_played_games(),
-                    )
-                ),
-                completions=True,
-            ),
-            gs.Selector.ONE_PER_YEAR_CHALLENGE: gs.get_one_per_criteria_challenge_selector(
-                "Year", self._data_provider, lambda g: g.release_year
-            ),
-            gs.Selector.ONE_PER_YEAR_CHALLENGE_COMPLETIONS: gs.get_one_per_criteria_challenge_selector(
-                "Year",
-                self._data_provider,
-                lambda g: g.release_year,
-                games_override=self._data_provider.get_played_games(),
-                completions=True,
-            ),
             gs.Selector.PALINDROMES: gs.PALINDROME_GAMES,
             gs.Selector.PERCENTILES: gs.get_percentiles_selector(self._data_provider),
             gs.Selector.PHYSICAL_GAMES: gs.PHYSICAL_GAMES,
@@ -755,6 +427,8 @@ class SelectorLibrary:
             gs.Selector.ZERO_PERCENT: gs.get_zero_percent_selector(self._data_provider),
         }
 
+        self.__add_one_per_criteria_challenges(top_developers)
+
         self._library[gs.Selector.TOP_BY_SELECTOR] = self.__get_top_by_selector()
         self._library[gs.Selector.SELECTORS_BY_GENRE] = (
             self.__get_selectors_by_condition(
@@ -767,6 +441,192 @@ class SelectorLibrary:
             self.__get_selectors_by_condition(gs.Selector.SELECTORS_BY_PLATFORM.value)
         )
 
+    def __add_one_per_criteria_challenges(self, top_developers: Set[str]):
+        def get_month_added(g: ExcelGame) -> str:
+            return (
+                g.date_added.strftime("%B, %Y")
+                if g.date_added is not None
+                else "No Added Date"
+            )
+
+        def get_month_purchased(g: ExcelGame) -> str:
+            return (
+                g.date_purchased.strftime("%B, %Y")
+                if g.date_purchased is not None
+                else "Not Purchased"
+            )
+
+        challenges = {
+            (
+                gs.Selector.ONE_PER_ADDED_DATE_CHALLENGE,
+                gs.Selector.ONE_PER_ADDED_DATE_CHALLENGE_COMPLETIONS,
+            ): gs.get_one_per_criteria_challenge_selectors(
+                "Added Date",
+                self._data_provider,
+                get_month_added,
+                _filter=lambda g: g.date_added is not None,
+                custom_grouping_sort=lambda kvp: kvp[1][-1].game.date_added
+                or datetime.datetime.max,
+                custom_grouping_sort_reverse=True,
+            ),
+            (
+                gs.Selector.ONE_PER_ALPHABET_CHALLENGE,
+                gs.Selector.ONE_PER_ALPHABET_CHALLENGE_COMPLETIONS,
+            ): gs.get_one_per_criteria_challenge_selectors(
+                "Letter", self._data_provider, gs.get_alphabetical_first_letter
+            ),
+            (
+                gs.Selector.ONE_PER_FAN_TRANSLATION_CHALLENGE,
+                gs.Selector.ONE_PER_FAN_TRANSLATION_CHALLENGE_COMPLETIONS,
+            ): gs.get_one_per_criteria_challenge_selectors(
+                "Fan Translation",
+                self._data_provider,
+                lambda g: gs.get_platform_completion_id(g)
+                + f" ({'Translated' if g.translation == TranslationStatus.COMPLETE else 'Untranslated'})",
+                _filter=lambda g: g.translation == TranslationStatus.COMPLETE
+                and not g.owned,
+            ),
+            (
+                gs.Selector.ONE_PER_FRANCHISE_CONTENDER_CHALLENGE,
+                gs.Selector.ONE_PER_FRANCHISE_CONTENDER_CHALLENGE_COMPLETIONS,
+            ): gs.get_one_per_criteria_challenge_selectors(
+                "Franchise Contender",
+                self._data_provider,
+                lambda g: g.franchise,
+                _filter=lambda g: g.franchise in gs.FRANCHISE_CONTENDERS,
+            ),
+            (
+                gs.Selector.ONE_PER_GENRE_CHALLENGE,
+                gs.Selector.ONE_PER_GENRE_CHALLENGE_COMPLETIONS,
+            ): gs.get_one_per_criteria_challenge_selectors(
+                "Genre", self._data_provider, lambda g: g.genre
+            ),
+            (
+                gs.Selector.ONE_PER_LIMITED_PRINT_CHALLENGE,
+                gs.Selector.ONE_PER_LIMITED_PRINT_CHALLENGE_COMPLETIONS,
+            ): gs.get_one_per_criteria_challenge_selectors(
+                "Limited Print",
+                self._data_provider,
+                lambda g: g.limited_print_company,
+                _filter=lambda g: g.limited_print_company is not None,
+            ),
+            # Completed 2 times
+            (
+                gs.Selector.ONE_PER_PERCENTILE_CHALLENGE,
+                gs.Selector.ONE_PER_PERCENTILE_CHALLENGE_COMPLETIONS,
+            ): gs.get_one_per_criteria_challenge_selectors(
+                "Percentile",
+                self._data_provider,
+                lambda g: gs.group_by_percentile(g, self._data_provider),
+                challenge_start=datetime.datetime(2025, 2, 5),
+                custom_grouping_sort=lambda kvp: self._data_provider.get_percentile_ranking_for_game(
+                    kvp[1][-1].game
+                ).value,
+                custom_grouping_sort_reverse=True,
+            ),
+            (
+                gs.Selector.ONE_PER_PLATFORM_CHALLENGE,
+                gs.Selector.ONE_PER_PLATFORM_CHALLENGE_COMPLETIONS,
+            ): gs.get_one_per_criteria_challenge_selectors(
+                "Platform",
+                self._data_provider,
+                gs.get_platform_completion_id,
+            ),
+            (
+                gs.Selector.ONE_PER_PLAYTIME_CHALLENGE,
+                gs.Selector.ONE_PER_PLAYTIME_CHALLENGE_COMPLETIONS,
+            ): gs.get_one_per_criteria_challenge_selectors(
+                "Playtime",
+                self._data_provider,
+                gs.get_playtime,
+                custom_grouping_sort=lambda kvp: (
+                    kvp[1][-1].game.estimated_playtime or 0
+                )
+                // 1,
+                completions_grouping_sort=lambda kvp: (
+                    kvp[1][-1].game.completion_time or 0
+                )
+                // 1,
+            ),
+            (
+                gs.Selector.ONE_PER_PURCHASE_DATE_CHALLENGE,
+                gs.Selector.ONE_PER_PURCHASE_DATE_CHALLENGE_COMPLETIONS,
+            ): gs.get_one_per_criteria_challenge_selectors(
+                "Purchase Date",
+                self._data_provider,
+                get_month_purchased,
+                _filter=lambda g: g.date_purchased is not None,
+                custom_grouping_sort=lambda kvp: kvp[1][-1].game.date_purchased
+                or datetime.datetime.max,
+                custom_grouping_sort_reverse=True,
+            ),
+            (
+                gs.Selector.ONE_PER_PURCHASE_PRICE_CHALLENGE,
+                gs.Selector.ONE_PER_PURCHASE_PRICE_CHALLENGE_COMPLETIONS,
+            ): gs.get_one_per_criteria_challenge_selectors(
+                "Purchase Price",
+                self._data_provider,
+                lambda g: (
+                    f"${int(g.purchase_price)}.00"
+                    if int(g.purchase_price or 0) > 0
+                    else "Free"
+                ),
+                _filter=lambda g: g.purchase_price is not None and g.purchase_price > 0,
+                completions_filter=lambda g: g.purchase_price is not None
+                and int(g.purchase_price) > 0,
+                custom_grouping_sort=lambda kvp: int(kvp[1][0].game.purchase_price),
+            ),
+            # Completed 1 time
+            (
+                gs.Selector.ONE_PER_RATING_CHALLENGE,
+                gs.Selector.ONE_PER_RATING_CHALLENGE_COMPLETIONS,
+            ): gs.get_one_per_criteria_challenge_selectors(
+                "Rating",
+                self._data_provider,
+                lambda g: f"{math.floor(g.combined_rating * 10) * 10}%",
+                challenge_start=datetime.datetime(2025, 2, 8),
+            ),
+            (
+                gs.Selector.ONE_PER_REGION_CHALLENGE,
+                gs.Selector.ONE_PER_REGION_CHALLENGE_COMPLETIONS,
+            ): gs.get_one_per_criteria_challenge_selectors(
+                "Region",
+                self._data_provider,
+                lambda g: g.release_region.name.replace("_", " ").title(),
+            ),
+            (
+                gs.Selector.ONE_PER_TITLE_LENGTH_CHALLENGE,
+                gs.Selector.ONE_PER_TITLE_LENGTH_CHALLENGE_COMPLETIONS,
+            ): gs.get_one_per_criteria_challenge_selectors(
+                "Title Length",
+                self._data_provider,
+                lambda g: len(g.title.replace(" ", "")),
+                custom_grouping_sort=lambda kvp: int(kvp[0]),
+            ),
+            (
+                gs.Selector.ONE_PER_TOP_DEVELOPER_CHALLENGE,
+                gs.Selector.ONE_PER_TOP_DEVELOPER_CHALLENGE_COMPLETIONS,
+            ): gs.get_one_per_criteria_challenge_selectors(
+                "Top Developer",
+                self._data_provider,
+                lambda g: g.developer,
+                _filter=lambda g: g.developer in top_developers,
+            ),
+            (
+                gs.Selector.ONE_PER_YEAR_CHALLENGE,
+                gs.Selector.ONE_PER_YEAR_CHALLENGE_COMPLETIONS,
+            ): gs.get_one_per_criteria_challenge_selectors(
+                "Year", self._data_provider, lambda g: g.release_year
+            ),
+        }
+
+        for (challenge, completions), (
+            challenge_selector,
+            completions_selector,
+        ) in challenges.items():
+            self._library[challenge] = challenge_selector
+            self._library[completions] = completions_selector
+
     def __get_top_by_selector(self) -> GameSelector:
         except_selectors: Set[gs.Selector] = set(
             [
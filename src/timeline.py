@@ -0,0 +1,97 @@
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+import datetime
+import heapq
+
+T = TypeVar("T")
+
+
+class Timeline(Generic[T]):
+    _points: List[Tuple[datetime.datetime, bool, int]]
+    _items: List[T]
+    _opens: Callable[[T], bool]
+
+    def __init__(
+        self,
+        items: Iterable[T],
+        get_start: Callable[[T], Optional[datetime.datetime]],
+        get_end: Callable[[T], Optional[datetime.datetime]],
+        opens: Callable[[T], bool] = lambda _: True,
+    ):
+        self._items = list(items)
+        self._opens = opens
+        self._points = []
+
+        for index, item in enumerate(self._items):
+            start = get_start(item)
+            end = get_end(item)
+
+            if start is not None:
+                self._points.append((start, False, index))
+            if end is not None:
+                self._points.append((end, True, index))
+
+        self._points.sort(key=lambda p: (p[0], p[1]))
+
+    def __sweep(self) -> Iterator[Tuple[datetime.datetime, Set[int], Set[int]]]:
+        active: Set[int] = set()
+        cur = 0
+
+        while cur < len(self._points):
+            date = self._points[cur][0]
+            touched: Set[int] = set()
+            first = True
+
+            while cur < len(self._points) and self._points[cur][0] == date:
+                _, end, index = self._points[cur]
+
+                if end:
+                    if not first or index not in active:
+                        touched.add(index)
+
+                    active.discard(index)
+                else:
+                    touched.add(index)
+
+                    if self._opens(self._items[index]):
+                        active.add(index)
+
+                first = False
+                cur += 1
+
+            yield (date, active, touched.difference(active))
+
+    def get_concurrency(self) -> Iterator[Tuple[datetime.datetime, int]]:
+        for date, active, touched in self.__sweep():
+            yield (date, len(active) + len(touched))
+
+    def get_items_on(
+        self, dates: Iterable[datetime.datetime]
+    ) -> Dict[datetime.datetime, List[T]]:
+        dates = set(dates)
+        items_on: Dict[datetime.datetime, List[T]] = {}
+
+        for date, active, touched in self.__sweep():
+            if date in dates:
+                items_on[date] = [self._items[i] for i in sorted(active.union(touched))]
+
+        return items_on
+
+    def get_most_concurrent(self, count: int) -> Dict[datetime.datetime, List[T]]:
+        most_concurrent = heapq.nsmallest(
+            count,
+            enumerate(self.get_concurrency()),
+            key=lambda p: (-p[1][1], p[0]),
+        )
+
+        return self.get_items_on(date for _, (date, _) in most_concurrent)
@@ -0,0 +1,66 @@
+import asyncio
+from typing import Dict, List, Optional, Tuple
+
+from clients import Game, GamePlatform, Platform
+
+
+def make_game(game_id: int, platforms: List[Platform]) -> Game:
+    return Game(
+        [],
+        None,
+        game_id,
+        [],
+        None,
+        f"https://www.mobygames.com/game/{game_id}",
+        None,
+        None,
+        [GamePlatform(p, "2000-01-01") for p in platforms],
+        None,
+        [],
+        f"Game {game_id}",
+    )
+
+
+class FakeMobyClient:
+    _platforms: List[Platform]
+    _games: Dict[int, List[Game]]
+    _fail_at: Optional[Tuple[int, int]]
+    _delay: float
+
+    requests: List[Tuple[int, int]]
+    in_flight: int
+    max_in_flight: int
+
+    def __init__(
+        self,
+        platforms: List[Platform],
+        games: Dict[int, List[Game]],
+        fail_at: Optional[Tuple[int, int]] = None,
+        delay: float = 0,
+    ):
+        self._platforms = platforms
+        self._games = games
+        self._fail_at = fail_at
+        self._delay = delay
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def platforms(self) -> List[Platform]:
+        return self._platforms
+
+    async def games(self, platform_ids: List[int], offset: int = 0) -> List[Game]:
+        platform_id = platform_ids[0]
+
+        if self._fail_at == (platform_id, offset):
+            raise ConnectionError(f"Interrupted at {platform_id}, offset {offset}")
+
+        self.requests.append((platform_id, offset))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        try:
+            await asyncio.sleep(self._delay)
+            return self._games.get(platform_id, [])[offset : offset + 100]
+        finally:
+            self.in_flight -= 1
@@ -0,0 +1,79 @@
+import asyncio
+import json
+import os
+
+import pytest
+
+from clients import Platform
+
+from fake_moby import FakeMobyClient, make_game
+from find_exclusives import ExclusivesCrawler
+
+SATURN = Platform(1, "SEGA Saturn")
+DREAMCAST = Platform(2, "Dreamcast")
+
+
+def get_games():
+    return {
+        SATURN.id: [
+            make_game(i, [SATURN] if i % 3 else [SATURN, DREAMCAST]) for i in range(250)
+        ],
+        DREAMCAST.id: [make_game(1000 + i, [DREAMCAST]) for i in range(40)],
+    }
+
+
+def read_exclusives(folder, name):
+    with open(os.path.join(folder, f"{name}.json"), "r", encoding="utf-8") as f:
+        return sorted(g["id"] for g in json.load(f))
+
+
+def test_crawl_resumes_after_interruption(tmp_path):
+    folder = str(tmp_path)
+    games = get_games()
+
+    interrupted = FakeMobyClient([SATURN], games, fail_at=(SATURN.id, 200))
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(ExclusivesCrawler(interrupted, folder=folder).crawl())
+
+    assert interrupted.requests == [(SATURN.id, 0), (SATURN.id, 100)]
+    assert not os.path.exists(os.path.join(folder, "sega_saturn.json"))
+
+    resumed = FakeMobyClient([SATURN], games)
+    asyncio.run(ExclusivesCrawler(resumed, folder=folder).crawl())
+
+    assert resumed.requests == [(SATURN.id, 200)]
+    assert read_exclusives(folder, "sega_saturn") == [i for i in range(250) if i % 3]
+    assert not os.path.exists(
+        os.path.join(folder, ExclusivesCrawler.CHECKPOINT_FOLDER, "sega_saturn")
+    )
+
+
+def test_crawl_skips_finished_platforms(tmp_path):
+    folder = str(tmp_path)
+    games = get_games()
+
+    asyncio.run(
+        ExclusivesCrawler(FakeMobyClient([DREAMCAST], games), folder=folder).crawl()
+    )
+
+    client = FakeMobyClient([SATURN, DREAMCAST], games)
+    asyncio.run(ExclusivesCrawler(client, folder=folder).crawl())
+
+    assert all(platform_id == SATURN.id for platform_id, _ in client.requests)
+    assert read_exclusives(folder, "dreamcast") == list(range(1000, 1040))
+
+
+def test_crawl_limits_concurrency(tmp_path):
+    platforms = [Platform(i, f"Platform {i}") for i in range(1, 9)]
+    games = {
+        p.id: [make_game(p.id * 1000 + i, [p]) for i in range(5)] for p in platforms
+    }
+    client = FakeMobyClient(platforms, games, delay=0.01)
+
+    asyncio.run(
+        ExclusivesCrawler(client, folder=str(tmp_path), max_concurrency=3).crawl()
+    )
+
+    assert client.max_in_flight == 3
+    assert len(client.requests) == len(platforms)